@@ -1,64 +1,54 @@
+import os
+import time
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import altair as alt
 
+from sections import intro
+from utils import i18n, perf
+from utils.assets import resized_image
+
+# Startup phases of this run (see perf.StartupReport): only light modules
+# are imported above, so the shell reaches the browser before pandas,
+# Altair and the dataset are loaded.
+STARTUP = perf.StartupReport()
 DATA_PATH = 'RTA Dataset.csv'
-ACCIDENT_SEVERITY_ORDER = ['Slight Injury', 'Serious Injury', 'Fatal Injury']
-CRITICAL_SEVERITY = ['Serious Injury', 'Fatal Injury']
+SIDEBAR_IMAGES = ["微信图片_20251123203603_26_25.jpg", "微信图片_20251123203604_27_25.jpg"]
+# Debug panels: append ?debug=1 to the URL or set RTA_DEBUG=1.
+DEBUG = st.query_params.get('debug') == '1' or os.environ.get('RTA_DEBUG') == '1'
+# Section timings are collected for the debug perf panel and for RTA_TRACE_FILE.
+TRACE = perf.start_trace(dataset=DATA_PATH) if DEBUG or perf.TRACE_FILE else None
+# Interface language: ?lang=zh or RTA_LANG. Every language renders the same
+# shared data and aggregation cache; only labels are translated (utils/i18n.py).
+LANG = st.query_params.get('lang', i18n.DEFAULT_LANGUAGE)
+if LANG not in i18n.LANGUAGES:
+    LANG = 'en'
+ui = i18n.LocalizedUI(st, LANG)
+# Layout: 'page' renders every section on each rerun; 'sections' (?nav=sections
+# or RTA_NAV=sections) shows one section at a time and computes only its
+# charts (sections/pages.py).
+NAV = st.query_params.get('nav', os.environ.get('RTA_NAV', 'page'))
+# Sample-first charts (?progressive=1 or RTA_PROGRESSIVE=1): charts whose exact
+# result misses RTA_LATENCY_TARGET are drawn from a stratified sample of
+# RTA_SAMPLE_SIZE rows first, then redrawn exact (utils/sampling.py).
+PROGRESSIVE = st.query_params.get('progressive', os.environ.get('RTA_PROGRESSIVE', '0')) == '1'
 
 st.set_page_config(
-    page_title="RTA Dashboard: Granular Multi-Dimensional Accident Analysis",
+    page_title=i18n.translate("RTA Dashboard: Granular Multi-Dimensional Accident Analysis", LANG),
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
-@st.cache_data(show_spinner="Loading and preparing data...")
-def load_data(path: str) -> pd.DataFrame:
-    """Loads the raw dataset, cleans column names, and sets data types."""
-
-    df = pd.read_csv(path)
-
-    df.columns = df.columns.str.replace('[^A-Za-z0-9_]+', '', regex=True).str.lower()
-
-    df = df.replace(['Unknown', 'unknown', 'na', '-1', 'Other'], np.nan)
-
-    df['time'] = pd.to_datetime(df['time'], format='%H:%M:%S', errors='coerce').dt.time
-
-    df['day_of_week'] = pd.Categorical(
-        df['day_of_week'], 
-        categories=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], 
-        ordered=True
-    )
-    df['accident_severity'] = pd.Categorical(
-        df['accident_severity'], 
-        categories=ACCIDENT_SEVERITY_ORDER, 
-        ordered=True
-    )
-
-    df['hour'] = df['time'].apply(lambda x: x.hour if pd.notna(x) else np.nan)
-
-    df['casualty_count'] = pd.to_numeric(df['number_of_casualties'], errors='coerce')
-
-    AGE_BANDS = ['Under 18', '18-30', '31-50', 'Over 51']
-    df['age_band_of_driver'] = pd.Categorical(df['age_band_of_driver'], categories=AGE_BANDS, ordered=True)
-    
-    EDU_LEVELS = ['Illiterate', 'Elementary school', 'Junior high school', 'High school graduate', 'Above high school', 'College & above']
-    df['educational_level'] = pd.Categorical(df['educational_level'], categories=EDU_LEVELS, ordered=True)
-    
-    return df
-
-def draw_chart(chart, title):
-    """Utility function to display charts with consistent styling."""
-    chart = chart.properties(title=title).interactive()
-    st.altair_chart(chart, use_container_width=True)
-
-df_data = load_data(DATA_PATH)
+@st.cache_resource
+def sidebar_image(path: str, width: int) -> bytes:
+    """Pre-resized copy of a sidebar photo (utils/assets.py), read once per process."""
+    with open(resized_image(path, width), 'rb') as f:
+        return f.read()
 
 with st.sidebar:
 
-    st.image("微信图片_20251123203603_26_25.jpg", width=100) 
-    st.image("微信图片_20251123203604_27_25.jpg", width=100) 
+    for image in SIDEBAR_IMAGES:
+        st.image(sidebar_image(image, 100), width=100)
+    STARTUP.lap('assets')
     st.markdown(
         '''
         <div style="line-height:1.1; font-size:14px;">
@@ -76,388 +66,197 @@ with st.sidebar:
     st.markdown("**Prof. Mano Mathew**")
     st.markdown("[Check out this LinkedIn](https://www.linkedin.com/in/manomathew/)", unsafe_allow_html=True)
     
-    st.title("Data Filters")
-    
-    st.header("1. Accident Severity")
-    selected_severity = st.multiselect(
-        "Severity Levels to Focus On:",
-        options=ACCIDENT_SEVERITY_ORDER,
-        default=ACCIDENT_SEVERITY_ORDER,
-        help="Select severity levels to include in charts and KPIs."
-    )
-    
-    st.header("2. Geographical Filter")
-    areas = df_data['area_accident_occured'].dropna().unique().tolist()
-    selected_areas = st.multiselect(
-        "Filter by Accident Area:",
-        options=areas,
-        default=areas
-    )
-    
-    st.markdown("---")
-    
-df_filtered = df_data[
-    (df_data['accident_severity'].isin(selected_severity)) &
-    (df_data['area_accident_occured'].isin(selected_areas))
-].copy()
-
-st.title("RTA Dashboard: Road Traffic Accident Multi-Dimensional Analysis")
-st.caption("Project Overview: Visualization and analysis of Ethiopian Road Traffic Accident (RTA) data across five customized analytical themes.")
-st.markdown("---")
-
-st.header("1. 🚨 Project Narrative: From Problem to Analysis Framework")
-st.markdown("---")
-
-st.subheader("The Problem: The Silent Crisis on Ethiopian Roads")
-st.error(
-    """
-    Road Traffic Accidents (RTAs) pose a critical public health and economic challenge globally, and particularly in developing nations. Ethiopia faces an alarming rate of severe accidents and fatalities. Traditional accident reports often focus only on aggregate counts, failing to provide the granular, multi-dimensional insights necessary for effective policy intervention. **The core problem is the lack of actionable intelligence**—policymakers need to understand *who*, *when*, *where*, and *why* the most dangerous accidents occur.
-    """
-)
-
-st.subheader("The Data Solution: Why This Dataset?")
-st.info(
-    """
-    This **Ethiopian Road Traffic Accident Dataset** was specifically selected because of its rich, interconnected variables that go beyond simple time/location data. It contains crucial **driver characteristics** (Age, Education, Experience), **environmental factors** (Weather, Road Surface), **behavioral causes** (`Cause_of_accident`), and detailed **severity** outcomes. This allows for a shift from simple counting to **causal and predictive analysis**.
+    languages = list(i18n.LANGUAGES)
+    chosen = st.selectbox("Language / 语言", languages, index=languages.index(LANG),
+                          format_func=i18n.LANGUAGES.get)
+    if chosen != LANG:
+        st.query_params['lang'] = chosen
+        st.rerun()
+
+ui.title("RTA Dashboard: Road Traffic Accident Multi-Dimensional Analysis")
+ui.caption("Project Overview: Visualization and analysis of Ethiopian Road Traffic Accident (RTA) data across five customized analytical themes.")
+ui.markdown("---")
+
+if NAV != 'sections':
+    with perf.section('intro'):
+        intro.show(ui)
+STARTUP.lap('shell')
+
+# Heavy imports (pandas, numpy, pyarrow, Altair) start here, once the shell is on screen.
+import pandas as pd
 
-    This project utilizes five analytical dimensions to convert raw data into targeted insights (Analysis Phase):
-    
-    * **Geographic Risk:** Where are the high-risk zones?
-    * **Temporal Patterns:** When are the high-risk hours/days?
-    * **Causal Factors:** Which driver actions and conditions lead to accidents?
-    * **Collision Mechanics:** Which collision types are most lethal?
-    * **Driver Demographics:** Which driver profiles are most vulnerable or dangerous?
+from sections import conclusions, data_quality, deep_dives, overview, pages
+from utils.filters import SIDEBAR_FILTERS, selection_counts
+from utils.live import LiveDataset
+from utils.memo import AggregationCache, memoized, selection_key
+from utils.sampling import LATENCY_TARGET, SAMPLE_SIZE, estimate_counts
+from utils.scheduler import make_pool, prefetch, progressive
+STARTUP.lap('import')
+
+@st.cache_resource(show_spinner="Loading and preparing data...")
+def get_live_dataset(path: str) -> LiveDataset:
+    """Versioned reference to the loaded dataset, its filter index, cube and
+    quality profile, shared by every session (utils/live.py).
+
+    Loaded once here; after that a background thread watches the source
+    (RTA_WATCH_INTERVAL) and swaps in new versions without blocking reruns,
+    so a changed CSV or an appended store batch needs no restart.
     """
-)
-st.markdown("---")
-
-col1, col2, col3 = st.columns(3)
-col1.metric("Total Accidents (Filtered)", f"{len(df_filtered):,}")
-col2.metric("Avg Casualties per Accident", f"{df_filtered['casualty_count'].mean():.2f}")
-critical_rate = (len(df_filtered[df_filtered['accident_severity'].isin(CRITICAL_SEVERITY)]) / len(df_filtered) * 100) if len(df_filtered) > 0 else 0
-col3.metric("Severe/Fatal Accident Rate", f"{critical_rate:.1f}%")
-
-st.markdown("---")
-
-st.header("2. 🗺️ Geographic Accident Comparison ")
-st.info("Objective: Identify high-risk geographical areas and analyze their primary collision characteristics.")
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Geographic Distribution of Accidents by Severity")
-    area_agg_severity = df_filtered.groupby(['area_accident_occured', 'accident_severity'], observed=True).size().reset_index(name='count')
-    
-    chart = alt.Chart(area_agg_severity).mark_circle(opacity=0.8).encode(
-        x=alt.X('accident_severity', title='Accident Severity', sort=ACCIDENT_SEVERITY_ORDER),
-        y=alt.Y('area_accident_occured', title='Accident Area Occurred', sort=alt.EncodingSortField(field='count', op='sum', order='descending')),
-        size=alt.Size('count', title='Accident Count', scale=alt.Scale(range=[50, 600])),
-        color=alt.Color('accident_severity', scale=alt.Scale(domain=ACCIDENT_SEVERITY_ORDER, range=['#4C78A8', '#E34C31', '#943E2C']), title='Severity'),
-        tooltip=['area_accident_occured', 'accident_severity', 'count']
-    ).properties(title="Area Accident Severity Distribution")
-    draw_chart(chart, "Area Accident Severity Distribution")
-
-with col2:
-    st.subheader("Major Collision Type Distribution by Area")
-    area_collision_agg = df_filtered.groupby(['area_accident_occured', 'type_of_collision'], observed=True).size().reset_index(name='count')
-    
-    chart = alt.Chart(area_collision_agg).mark_bar().encode(
-        x=alt.X('count', stack="normalize", title='Collision Type Proportion'),
-        y=alt.Y('area_accident_occured', title='Accident Area Occurred', sort=alt.EncodingSortField(field='count', op='sum', order='descending')),
-        color=alt.Color('type_of_collision', title='Collision Type', scale=alt.Scale(scheme='category10')),
-        tooltip=['area_accident_occured', 'type_of_collision', alt.Tooltip('count', format=',')]
-    ).properties(title="Area Collision Type Proportion")
-    draw_chart(chart, "Major Collision Type Distribution by Area")
-
-st.markdown("---")
-
-
-st.header("3. ⏱️ Temporal Accident Analysis")
-st.info("Objective: Determine high-risk time windows within a day and observe the temporal changes in collision types.")
-col1, col2 = st.columns(2)
-with col1:
-    st.subheader("Hourly Accident Count and Severity Trend")
-    time_severity_agg = df_filtered.groupby(['hour', 'accident_severity'], observed=True).size().reset_index(name='count')
-    
-    chart = alt.Chart(time_severity_agg).mark_line(point=True).encode(
-        x=alt.X('hour', title='Hour of Day'),
-        y=alt.Y('count', title='Accident Count'),
-        color=alt.Color('accident_severity', scale=alt.Scale(domain=ACCIDENT_SEVERITY_ORDER, range=['#4C78A8', '#E34C31', '#943E2C']), title='Severity'),
-        tooltip=['hour', 'accident_severity', 'count']
-    ).properties(title="Accident Trends Grouped by Hour and Severity")
-    draw_chart(chart, "Hourly Accident Count and Severity Trend")
-
-with col2:
-    st.subheader("Collision Type Distribution Across Different Hours")
-    time_collision_agg = df_filtered.groupby(['hour', 'type_of_collision'], observed=True).size().reset_index(name='count')
-    
-    top_collisions = time_collision_agg.groupby('type_of_collision')['count'].sum().nlargest(5).index.tolist()
-    time_collision_agg = time_collision_agg[time_collision_agg['type_of_collision'].isin(top_collisions)]
-
-    chart = alt.Chart(time_collision_agg).mark_bar().encode(
-        x=alt.X('type_of_collision', title='Collision Type'),
-        y=alt.Y('count', title='Accident Count'),
-        column=alt.Column('hour', header=alt.Header(titleOrient="bottom"), title='Hour'),
-        color=alt.Color('type_of_collision', title='Collision Type', scale=alt.Scale(scheme='category10')),
-        tooltip=['hour', 'type_of_collision', 'count']
-    ).properties(title="Collision Type Distribution by Hour (Top 5)")
-    draw_chart(chart, "Collision Type Distribution by Hour (Grouped Bar Chart)")
-    
-st.markdown("---")
-
-st.header("4.Factor Analysis: Contributing Factors")
-st.info("Objective: Examine the impact of driver personal factors, environmental conditions (weather/road), and driving behavior on accident frequency and severity.")
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.subheader("Driver Personal Features and Severe Accident Count")
-    
-    df_severe = df_filtered[df_filtered['accident_severity'].isin(CRITICAL_SEVERITY)].copy()
-    
-    st.markdown("##### Severe Accident Count by Age Band")
-    age_agg = df_severe.groupby('age_band_of_driver', observed=True).size().reset_index(name='Severe_Count')
-    chart_age = alt.Chart(age_agg).mark_bar(color='#E34C31').encode(
-        x=alt.X('Severe_Count', title='Severe/Fatal Accident Count'),
-        y=alt.Y('age_band_of_driver', title='Age Band', sort=None),
-        tooltip=['age_band_of_driver', 'Severe_Count']
-    )
-    draw_chart(chart_age, "Severe Accident Count by Age Band")
-
-    st.markdown("##### Severe Accident Count by Driving Experience")
-    exp_agg = df_severe.groupby('driving_experience', observed=True).size().reset_index(name='Severe_Count')
-    chart_exp = alt.Chart(exp_agg).mark_bar(color='#CC6633').encode(
-        x=alt.X('Severe_Count', title='Severe/Fatal Accident Count'),
-        y=alt.Y('driving_experience', title='Driving Experience', sort=None),
-        tooltip=['driving_experience', 'Severe_Count']
-    )
-    draw_chart(chart_exp, "Severe Accident Count by Driving Experience")
-    
-    st.markdown("##### Severe Accident Count by Sex")
-    sex_agg = df_severe.groupby('sex_of_driver', observed=True).size().reset_index(name='Severe_Count')
-    chart_sex = alt.Chart(sex_agg).mark_bar(color='#943E2C').encode(
-        x=alt.X('Severe_Count', title='Severe/Fatal Accident Count'),
-        y=alt.Y('sex_of_driver', title='Driver Sex', sort=None),
-        tooltip=['sex_of_driver', 'Severe_Count']
-    )
-    draw_chart(chart_sex, "Severe Accident Count by Driver Sex")
-
-with col2:
-    st.subheader("Impact of Weather and Road Surface Combination")
-    weather_surface_agg = df_filtered.groupby(['weather_conditions', 'road_surface_type'], observed=True).size().reset_index(name='count')
-    
-    chart = alt.Chart(weather_surface_agg).mark_rect().encode(
-        x=alt.X('road_surface_type', title='Road Surface Type'),
-        y=alt.Y('weather_conditions', title='Weather Condition'),
-        color=alt.Color('count', scale=alt.Scale(range='heatmap'), title='Accident Count'),
-        tooltip=['road_surface_type', 'weather_conditions', 'count']
-    ).properties(title="Accident Heatmap: Weather vs. Road Surface")
-    draw_chart(chart, "Impact of Weather and Road Surface Combination")
-
-with col3:
-    st.subheader("Driver Behavior and Accident Severity Proportion")
-    
-    behavior_severity_agg = df_filtered.groupby(['cause_of_accident', 'accident_severity'], observed=True).size().reset_index(name='count')
-    
-    total_by_cause = behavior_severity_agg.groupby('cause_of_accident')['count'].sum()
-    top_10_causes = total_by_cause.nlargest(10).index.tolist()
-    
-    behavior_severity_agg = behavior_severity_agg[behavior_severity_agg['cause_of_accident'].isin(top_10_causes)].copy()
-
-    chart = alt.Chart(behavior_severity_agg).mark_bar().encode(
-        x=alt.X('count', stack="normalize", title='Accident Severity Proportion'),
-        y=alt.Y('cause_of_accident', title='Driver Behavior (Top 10 Causes)', 
-                sort=alt.EncodingSortField(field='count', op='sum', order='descending')),
-        color=alt.Color('accident_severity', scale=alt.Scale(domain=ACCIDENT_SEVERITY_ORDER, range=['#4C78A8', '#E34C31', '#943E2C']), title='Severity'),
-        tooltip=['cause_of_accident', 'accident_severity', alt.Tooltip('count', format=',')]
-    ).properties(title="Accident Severity Proportion by Driver Behavior")
-    draw_chart(chart, "Driver Behavior and Accident Severity Proportion")
-
-st.markdown("---")
-
-st.header("5. 💥 Collision Type and Casualty Relationship")
-st.info("Objective: Quantify the frequency, severity, and casualty impact of different collision types (`type_of_collision`).")
-col1, col2, col3 = st.columns(3)
+    live = LiveDataset(path)
+    live.current()
+    return live
+
+@st.cache_resource
+def get_aggregation_cache() -> AggregationCache:
+    """LRU cache of aggregated chart frames, shared by every session on this server."""
+    return AggregationCache()
+
+@st.cache_resource
+def get_aggregation_pool():
+    """Worker threads that run the chart aggregations of a rerun concurrently
+    (RTA_AGG_WORKERS, shared by every session; None runs them in order)."""
+    return make_pool()
+
+with perf.section('load'), perf.timed('prep', 'load_data'):
+    # One snapshot per rerun: a version swapped in meanwhile is picked up by
+    # the next rerun, never half-way through this one.
+    live = get_live_dataset(DATA_PATH)
+    snapshot = live.current()
+    df_data = snapshot.data
+STARTUP.lap('data')
 
-with col1:
-    st.subheader("Collision Type Frequency (Top 5)")
-    collision_counts = df_filtered['type_of_collision'].value_counts().head(5).reset_index(name='Count')
-    collision_counts.columns = ['type_of_collision', 'Count']
-    
-    chart = alt.Chart(collision_counts).mark_arc(outerRadius=120).encode(
-        theta=alt.Theta(field="Count", type="quantitative"),
-        color=alt.Color(field="type_of_collision", type="nominal", title='Collision Type', scale=alt.Scale(scheme='category10')),
-        order=alt.Order("Count", sort="descending"),
-        tooltip=['type_of_collision', alt.Tooltip('Count', format=',')]
-    ).properties(title="Top 5 Collision Type Proportion")
-    draw_chart(chart, "Collision Type Frequency")
-
-with col2:
-    st.subheader("Collision Type vs. Accident Severity Proportion")
-    collision_severity_agg = df_filtered.groupby(['type_of_collision', 'accident_severity'], observed=True).size().reset_index(name='count')
-    
-    chart = alt.Chart(collision_severity_agg).mark_bar().encode(
-        x=alt.X('count', stack="normalize", title='Accident Proportion'),
-        y=alt.Y('type_of_collision', title='Collision Type', sort=alt.EncodingSortField(field='count', op='sum', order='descending')),
-        color=alt.Color('accident_severity', scale=alt.Scale(domain=ACCIDENT_SEVERITY_ORDER, range=['#4C78A8', '#E34C31', '#943E2C']), title='Severity'),
-        tooltip=['type_of_collision', 'accident_severity', alt.Tooltip('count', format=',')]
-    ).properties(title="Collision Type and Severity Proportion")
-    draw_chart(chart, "Collision Type vs. Accident Severity Proportion")
+with st.sidebar:
 
-with col3:
-    st.subheader("Impact of Collision Type on Average Casualties")
+    ui.title("Data Filters")
     
-    casualty_agg = df_filtered.groupby('type_of_collision', observed=True)['casualty_count'].agg(
-        mean='mean',
-        std='std'
-    ).reset_index()
+    bitmaps = snapshot.bitmaps
+    selection = {}
+    for sidebar_filter in SIDEBAR_FILTERS:
+        ui.header(sidebar_filter['header'])
+        options = list(bitmaps[sidebar_filter['column']])
+        selection[sidebar_filter['column']] = ui.multiselect(
+            sidebar_filter['label'],
+            options=options,
+            default=options,
+            column=sidebar_filter['column'],
+            help=sidebar_filter.get('help')
+        )
     
-    casualty_agg['lower_bound'] = casualty_agg['mean'] - casualty_agg['std']
-    casualty_agg['upper_bound'] = casualty_agg['mean'] + casualty_agg['std']
-    casualty_agg['lower_bound'] = casualty_agg['lower_bound'].apply(lambda x: max(0, x))
-
-    bar = alt.Chart(casualty_agg).mark_bar(color='#4C78A8').encode(
-        y=alt.Y('type_of_collision', title='Collision Type', sort='-x'),
-        x=alt.X('mean', title='Average Casualties'),
-        tooltip=['type_of_collision', alt.Tooltip('mean', format='.2f', title='Average Casualties'), alt.Tooltip('std', format='.2f', title='Standard Deviation')]
-    ).properties(title="Collision Type vs. Average Casualties")
-
-    error_bars = alt.Chart(casualty_agg).mark_rule().encode(
-        y=alt.Y('type_of_collision', title='Collision Type'),
-        x=alt.X('lower_bound', title=''),
-        x2='upper_bound'
+    st.markdown("---")
+    loaded = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshot.loaded_at))
+    ui.caption(i18n.text(ui, "Data version {version} · {rows:,} rows · loaded {loaded}",
+                         version=snapshot.version, rows=len(df_data), loaded=loaded))
+    if live.error is not None:
+        ui.warning(i18n.text(ui, "Reloading the data failed ({error}); still showing version {version}.",
+                             error=live.error, version=snapshot.version))
+
+counts = selection_counts(selection, snapshot.cube, df_data, bitmaps)
+scope = (os.path.abspath(DATA_PATH), snapshot.version, selection_key(selection))
+counts = memoized(get_aggregation_cache(), counts, scope)
+if TRACE is not None:
+    TRACE.meta['selection'] = selection
+    TRACE.meta['lang'] = LANG
+    TRACE.meta['version'] = snapshot.version
+
+def quality_report() -> dict:
+    """Data-quality report of the served version (built with its snapshot)."""
+    return snapshot.quality
+
+def schedule(counts, chart_ids: list = None):
+    """Starts the rerun's aggregations (prefetch); in progressive mode,
+    charts still computing at the latency target get a sample estimate.
+    Returns counts and, in progressive mode, the finish() that waits for
+    the exact results."""
+    sample = snapshot.sample(SAMPLE_SIZE) if PROGRESSIVE else None
+    if sample is None or sample.complete:
+        return prefetch(counts, get_aggregation_pool(), chart_ids), None
+    estimate = estimate_counts(sample, selection, df_data, bitmaps)
+    # Exact results already cached (e.g. by the previous rerun's finish())
+    # are drawn as they are, pool or not.
+    cached = lambda chart_id: get_aggregation_cache().peek(scope + (chart_id,))
+    return progressive(counts, estimate, get_aggregation_pool(), LATENCY_TARGET, chart_ids, cached)
+
+if NAV == 'sections':
+    # Only the chosen section runs: its charts are the only aggregations
+    # scheduled, and their results stay in the aggregation cache (keyed by
+    # version and selection), so switching back to a section is a cache hit.
+    page_ids = list(pages.PAGES)
+    if 'section' not in st.session_state:
+        # Opened from a link: start on its ?section=, then follow the widget.
+        linked = st.query_params.get('section')
+        st.session_state['section'] = linked if linked in page_ids else page_ids[0]
+    page_id = st.radio(
+        i18n.translate("Section", LANG),
+        page_ids,
+        key='section',
+        format_func=lambda page_id: i18n.translate(pages.PAGES[page_id]['label'], LANG),
+        horizontal=True,
+        label_visibility='collapsed',
     )
-    
-    chart = bar + error_bars
-    draw_chart(chart, "Collision Type vs. Average Casualties (Mean + Std Dev)")
-
-
-st.markdown("---")
-
-st.header("6. 👤 Driver Feature and Accident Severity Correlation")
-st.info("Objective: Explore the complex relationship between driver characteristics, suchs as age and education, and accident severity.")
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Educational Level and Accident Severity Proportion")
-    edu_severity_agg = df_filtered.groupby(['educational_level', 'accident_severity'], observed=True).size().reset_index(name='count')
-    
-    chart = alt.Chart(edu_severity_agg).mark_bar().encode(
-        x=alt.X('educational_level', title='Educational Level', sort=None), 
-        y=alt.Y('count', stack="normalize", title='Accident Proportion'),
-        color=alt.Color('accident_severity', scale=alt.Scale(domain=ACCIDENT_SEVERITY_ORDER, range=['#4C78A8', '#E34C31', '#943E2C']), title='Severity'),
-        tooltip=['educational_level', 'accident_severity', alt.Tooltip('count', format=',')]
-    ).properties(title="Educational Level vs. Accident Severity Proportion")
-    draw_chart(chart, "Educational Level vs. Accident Severity Proportion")
-
-with col2:
-    st.subheader("Driver Age, Experience, and Severe Accident")
-
-    df_severe = df_filtered[df_filtered['accident_severity'].isin(CRITICAL_SEVERITY)].copy()
-
-    age_exp_agg = df_severe.groupby(['driving_experience', 'age_band_of_driver'], observed=True).size().reset_index(name='Severe_Count')
-
-    chart = alt.Chart(age_exp_agg).mark_rect().encode(
-        x=alt.X('driving_experience', title='Driving Experience', sort=None),
-        y=alt.Y('age_band_of_driver', title='Age Band', sort=None),
-        color=alt.Color('Severe_Count', scale=alt.Scale(range='heatmap'), title='Severe Accident Count'),
-        tooltip=['age_band_of_driver', 'driving_experience', 'Severe_Count']
-    ).properties(title="Driving Experience vs. Age Band Severe Accident")
-    draw_chart(chart, "Driver Age, Experience, and Severe Accident")
-
-st.markdown("---")
-
-# === Data Quality & Missingness Report ===
-st.header("Data Quality & Missingness Report")
-st.info("Summary of missing values, duplicates, and simple validation checks. Review before using the analysis results.")
-
-# Missing values per column
-missing = df_data.isna().sum().reset_index()
-missing.columns = ['column', 'missing_count']
-missing['missing_pct'] = (missing['missing_count'] / len(df_data) * 100).round(2)
-missing = missing.sort_values('missing_pct', ascending=False)
-
-st.subheader("Missing Values by Column")
-st.write(f"Total rows: {len(df_data):,}")
-st.table(missing)
-
-# Show a compact bar chart of top columns with missingness
-top_missing = missing[missing['missing_count'] > 0].head(20)
-if not top_missing.empty:
-    chart = alt.Chart(top_missing).mark_bar(color='#CC6666').encode(
-        x=alt.X('missing_pct:Q', title='Missing %'),
-        y=alt.Y('column:N', sort=alt.SortField('missing_pct', order='descending')),
-        tooltip=[alt.Tooltip('missing_count:Q', title='Missing count'), alt.Tooltip('missing_pct:Q', title='Missing %')]
-    ).properties(height=400)
-    draw_chart(chart, "Top Columns by Missing Percentage")
+    st.query_params['section'] = page_id
+    counts, finish = schedule(counts, pages.PAGES[page_id]['charts'])
+    counts = perf.timed_counts(counts)
+    with perf.section(page_id):
+        pages.show(page_id, counts, quality_report, ui)
 else:
-    st.success("No missing values detected in the dataset.")
-
-# Duplicate rows check
-dup_count = df_data.duplicated().sum()
-st.subheader("Duplicate Rows")
-st.write(f"Duplicate rows detected: {dup_count}")
-if dup_count > 0:
-    st.write("Preview of duplicate rows:")
-    st.dataframe(df_data[df_data.duplicated()].head(5))
-
-# Simple row-level missingness distribution (how many rows have N missing cols)
-st.subheader("Row-level Missingness Distribution")
-row_missing = df_data.isna().sum(axis=1).value_counts().reset_index()
-row_missing.columns = ['missing_cols_count', 'row_count']
-row_missing = row_missing.sort_values('missing_cols_count')
-st.bar_chart(row_missing.set_index('missing_cols_count'))
+    counts, finish = schedule(counts)
+    counts = perf.timed_counts(counts)
 
-st.markdown("---")
+    with perf.section('overview'):
+        overview.show(counts, ui)
+    with perf.section('deep_dives'):
+        deep_dives.show(counts, ui)
 
-st.header("7. 💡 Insights & Next Steps")
+    # === Data Quality & Missingness Report ===
+    with perf.section('data_quality'):
+        data_quality.show(quality_report(), ui)
 
-st.markdown("""
-Based on the in-depth analysis across five dimensions, we can identify key risk factors contributing to severe traffic accidents, providing clear direction for traffic safety policy development.
-""")
-
-st.subheader("Key Insights")
-
-st.success(
-    """
-    **1. Risk Concentration by Area:**
-    * **High-risk areas** (`Office areas`, `Residential areas`) show not only high total accident volumes but also a significantly higher proportion of **'Vehicle with vehicle collision'**, suggesting inadequate traffic management and flow in these areas during peak hours.
-
-    **2. Elevated Risk During Evenings and Weekends:**
-    * **High-risk periods** concentrate between **17:00 and 20:00**. The proportion of severe accident types like **'Rear-end'** and **'Side collision'** increases during these hours, indicating a combined effect of driver fatigue, impatience, and low light conditions.
-
-    **3. Behavioral Factors as Primary Cause for Severe Casualties:**
-    * **Driver Behavior** analysis clearly shows that specific actions (e.g., `No distancing`, `Changing lane to the right`) account for the largest proportion of all accidents and also exhibit the highest **Severe/Fatal Accident Proportion**, confirming that subjective behavioral errors are the most direct cause of severe outcomes.
-    * **Personal features** analysis indicates the largest volume of risk is concentrated among **18-30 year-old** and **male** drivers, necessitating targeted public awareness and enforcement.
-
-    **4. High-Risk Collision Types:**
-    * The **Average Casualties Bar Chart** highlights that **'Overturning'** and **'Collision with fixed objects'** have the highest average casualties and standard deviation, marking them as high fatality/disability risk types.
-    * The **Severity Proportion Stacked Bar Chart** confirms these types have the highest proportion of Severe/Fatal outcomes.
-
-    **5. Focus on Less Educated Drivers:**
-    * **Educational Level** analysis reveals that drivers with lower education levels (e.g., `Elementary school`, `Junior high school`) contribute to a high volume of accidents, and their severe accident proportion warrants attention, potentially linked to understanding of traffic laws and risk judgment.
-    * The **Age-Experience Heatmap** clearly identifies the combination of **18-30 year-old** drivers with **2-5 years of experience** as the **primary hotspot** for severe accidents, designating young and moderately experienced drivers as the priority target for intervention.
-    """
-)
-
-st.subheader("Next Steps and Recommendations")
-
-st.markdown(
-    """
-    Based on the data insights above, we recommend implementing the following three targeted actions:
-    
-    1.  **🎯 Enforcement and Intervention for High-Risk Behaviors:**
-        * **Enforcement Focus:** Shift enforcement from solely speed limits to **dangerous driving behaviors**, such as **`No distancing`** and **improper lane changing**. Utilize automated monitoring systems to specifically identify and penalize these high-risk actions.
-        * **Road Deployment:** Install electronic surveillance in high-density areas (e.g., `Office areas`) to monitor frequently occurring **rear-end** and **side collisions**.
-        
-    2.  **🏗️ Infrastructure and Awareness Optimization for Critical Time Windows:**
-        * **Night Illumination:** Prioritize the repair and addition of road lighting to mitigate the **environmental amplification of risk** during nighttime accidents.
-        * **Awareness Campaigns:** Traffic safety campaigns should focus on the **17:00 - 20:00** window, reminding drivers of the impact of fatigue and emotion on driving performance.
-        
-    3.  **📚 Driver Training and Education System Improvement:**
-        * **Targeted Training:** Design intensive training programs specifically for the high-risk group of **18-30 year-old drivers with 2-5 years of experience** to enhance their practical risk awareness.
-        * **Risk Education:** Incorporate mandatory education on the consequences of high-risk collision types (like **overturning** and **hitting fixed objects**) into driving tests and annual reviews.
-        * **Basic Education:** Consider offering free or mandatory **traffic rule reinforcement courses** for drivers with lower educational backgrounds or specific experience ranges to improve their risk identification and avoidance skills.
-    """
-)
+    st.markdown("---")
 
-st.markdown("---")
-st.markdown("Created for #EFREIDataStoriesWUT2025 | Data Visualization Project")
\ No newline at end of file
+    with perf.section('conclusions'):
+        conclusions.show(ui)
+
+STARTUP.lap('render')
+FIRST_STARTUP = perf.finish_startup(STARTUP)
+
+if DEBUG:
+    with st.sidebar.expander("Debug: startup", expanded=True):
+        st.caption(f"This run: {STARTUP.format()}")
+        st.caption(f"First run in this process: {FIRST_STARTUP.format()}")
+        st.dataframe(
+            pd.DataFrame({'this run': STARTUP.phases, 'first run': FIRST_STARTUP.phases}).style.format('{:.3f}')
+        )
+    with st.sidebar.expander("Debug: aggregation cache", expanded=True):
+        stats = get_aggregation_cache().stats()
+        col1, col2 = st.columns(2)
+        col1.metric("Hits", f"{stats['hits']:,}")
+        col2.metric("Misses", f"{stats['misses']:,}")
+        col1.metric("Hit rate", f"{stats['hit_rate']:.0%}")
+        col2.metric("Evictions", f"{stats['evictions']:,}")
+        st.caption(f"{stats['entries']} / {stats['maxsize']} entries (RTA_AGG_CACHE_SIZE)")
+        if st.button("Clear aggregation cache"):
+            get_aggregation_cache().clear()
+
+if TRACE is not None:
+    perf.stop_trace()
+    if perf.TRACE_FILE:
+        TRACE.dump(perf.TRACE_FILE)
+    if DEBUG:
+        with st.sidebar.expander("Debug: perf", expanded=True):
+            summary = TRACE.summary()
+            st.caption(f"Run {TRACE.run_id}: {summary['total'].sum():.3f}s in timed sections")
+            st.dataframe(summary.style.format('{:.3f}'))
+            slowest = TRACE.frame().query("phase != 'total'").nlargest(5, 'seconds')
+            st.markdown("Slowest items")
+            st.dataframe(slowest[['section', 'phase', 'name', 'seconds']], hide_index=True)
+            payloads = pd.DataFrame(TRACE.payloads, columns=['section', 'name', 'rows', 'bytes'])
+            st.markdown(f"Chart payloads: {payloads['bytes'].sum() / 1024:,.1f} KB in {len(payloads)} charts")
+            st.dataframe(payloads.sort_values('bytes', ascending=False), hide_index=True)
+
+# Progressive mode: estimated charts are on screen; once their exact results
+# are in the aggregation cache, one more rerun draws them in place.
+if finish is not None:
+    exact_key = (snapshot.version, selection_key(selection), NAV, st.session_state.get('section'))
+    if finish() and st.session_state.get('progressive_exact') != exact_key:
+        st.session_state['progressive_exact'] = exact_key
+        st.rerun()
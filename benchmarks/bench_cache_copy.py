@@ -0,0 +1,75 @@
+"""Benchmark: per-rerun cost of getting the base DataFrame from the Streamlit cache.
+
+Run from the project root:
+
+    python -m benchmarks.bench_cache_copy --rows 100000 1000000 4000000
+
+Compares, for a synthetic cleaned dataset (benchmarks/synthetic.py):
+
+  cache_data       @st.cache_data, as app.py's load_data was: every hit
+                   unpickles a full copy of the frame
+  cache_resource   @st.cache_resource over utils.shared.freeze: every hit
+                   returns the same read-only frame
+
+Reported per cache hit (what each rerun pays before any filtering): wall
+time and peak allocation (tracemalloc), median of --repeat hits. Runs
+outside a Streamlit server, with the in-memory cache storage.
+"""
+import argparse
+import logging
+import statistics
+import time
+import tracemalloc
+
+import streamlit as st
+
+from benchmarks.synthetic import synthesize
+from utils.prep import clean_and_engineer_features
+from utils.shared import freeze
+
+FRAMES = {}
+
+
+@st.cache_data(show_spinner=False)
+def cached_data(rows: int):
+    return FRAMES[rows]
+
+
+@st.cache_resource(show_spinner=False)
+def cached_resource(rows: int):
+    return freeze(FRAMES[rows])
+
+
+def measure(func, rows: int, repeat: int) -> tuple:
+    func(rows)  # populate the cache
+    seconds, peaks = [], []
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func(rows)
+        seconds.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.median(seconds), statistics.median(peaks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 4_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    # Outside `streamlit run` every cache call warns about the missing runtime.
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    print(f"{'rows':>10} {'frame MB':>9} {'cache':>15} {'ms/rerun':>9} {'peak MB/rerun':>14}")
+    for rows in args.rows:
+        FRAMES[rows] = clean_and_engineer_features(synthesize(rows))
+        frame_mb = FRAMES[rows].memory_usage(deep=True).sum() / 1e6
+        for name, func in [('cache_data', cached_data), ('cache_resource', cached_resource)]:
+            seconds, peak = measure(func, rows, args.repeat)
+            print(f"{rows:>10,} {frame_mb:>9.1f} {name:>15} {seconds * 1e3:>9.2f} {peak / 1e6:>14.2f}")
+        del FRAMES[rows]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: DataFrame.duplicated() vs. 64-bit row fingerprints.
+
+Run from the project root:
+
+    python -m benchmarks.bench_dedup --rows 10000000 --dup-rate 0.05
+
+Synthetic rows (benchmarks/synthetic.py) are cleaned, then a --dup-rate share
+of them is overwritten with copies of random earlier rows. Timed:
+
+  duplicated        df.duplicated(), as the data-quality block called it (twice)
+  fingerprints      utils.dedup.row_fingerprints over the categorical codes
+  profile           utils.quality.QualityProfile over the fingerprints (missing
+                    values, duplicate count and groups), as the data-quality
+                    section builds it
+  drop              utils.dedup.drop_duplicates
+  ingest_chunks     FingerprintSet fed in --chunksize batches, as during ingest
+
+Duplicate counts from every path are checked against duplicated().
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthesize
+from utils.dedup import FingerprintSet, drop_duplicates, row_fingerprints
+from utils.prep import clean_and_engineer_features
+from utils.quality import QualityProfile
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--dup-rate', type=float, default=0.05)
+    parser.add_argument('--chunksize', type=int, default=250_000)
+    args = parser.parse_args()
+
+    df = clean_and_engineer_features(synthesize(args.rows))
+    rng = np.random.default_rng(1)
+    targets = rng.choice(np.arange(1, args.rows), int(args.rows * args.dup_rate), replace=False)
+    sources = (rng.random(len(targets)) * targets).astype(np.int64)
+    df.iloc[targets] = df.iloc[sources].to_numpy()
+    print(f"{args.rows:,} rows, {df.memory_usage(deep=True).sum() / 1e6:.0f} MB")
+
+    results = {}
+    results['duplicated'], expected = timed(lambda: int(df.duplicated().sum()))
+    results['fingerprints'], fingerprints = timed(row_fingerprints, df)
+    results['profile'], profile = timed(lambda: QualityProfile(df.columns).update(df, fingerprints))
+    results['drop'], (_, dropped) = timed(drop_duplicates, df)
+
+    def ingest_chunks():
+        seen, found = FingerprintSet(), 0
+        for start in range(0, args.rows, args.chunksize):
+            found += int(seen.add(fingerprints[start:start + args.chunksize]).sum())
+        return found
+    results['ingest_chunks'], chunked = timed(ingest_chunks)
+
+    for name, seconds in results.items():
+        print(f"  {name:<14} {seconds:>8.2f}s")
+    print(f"  duplicate rows: {expected:,} (duplicated), {profile.duplicate_count:,} (profile), "
+          f"{dropped:,} (drop), {chunked:,} (chunked); {profile.duplicate_groups:,} groups")
+    assert expected == profile.duplicate_count == dropped == chunked
+
+
+if __name__ == '__main__':
+    main()
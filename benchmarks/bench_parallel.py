@@ -0,0 +1,72 @@
+"""Benchmark: wall-clock rerun time of all chart aggregations vs. pool size.
+
+Run from the project root:
+
+    python -m benchmarks.bench_parallel --rows 1000000 --workers 1 2 4 8
+
+One rerun computes every chart of utils.aggregations.CHARTS for one
+selection, through utils.scheduler.prefetch with a pool of each --workers
+size (1 = sequential), and reads the results back in layout order:
+
+  view   a selection on a column outside the cube (weather_conditions), so
+         every chart is a group-by over the selected rows (FilteredView)
+  cube   the sidebar selection, served from the count cube
+
+Speed-up depends on how much of each kernel runs without the GIL, and is
+capped by the number of cores (printed first). Median of --repeat reruns.
+"""
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks.synthetic import synthesize
+from utils.aggregations import CHARTS
+from utils.cube import build_cube
+from utils.filters import build_bitmaps, selection_counts
+from utils.prep import clean_and_engineer_features
+from utils.scheduler import make_pool, prefetch
+
+
+def rerun(counts, pool) -> float:
+    start = time.perf_counter()
+    counts = prefetch(counts(), pool)
+    for chart_id in CHARTS:
+        counts(chart_id)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    df = clean_and_engineer_features(synthesize(args.rows))
+    cube = build_cube(df)
+    columns = ['accident_severity', 'area_accident_occured', 'weather_conditions']
+    bitmaps = build_bitmaps(df, columns)
+    areas = list(bitmaps['area_accident_occured'])
+    sidebar = {'accident_severity': list(bitmaps['accident_severity']), 'area_accident_occured': areas[:len(areas) // 2 + 1]}
+    paths = {
+        # A fresh view per rerun, as the app builds one per script run.
+        'view': lambda: selection_counts({**sidebar, 'weather_conditions': ['Normal', 'Raining']}, cube, df, bitmaps),
+        'cube': lambda: selection_counts(sidebar, cube, df, bitmaps),
+    }
+
+    print(f"{args.rows:,} rows, {len(CHARTS)} charts, {os.cpu_count()} cores")
+    print(f"{'path':>5} {'workers':>8} {'ms/rerun':>9} {'speed-up':>9}")
+    for name, counts in paths.items():
+        sequential = None
+        for workers in args.workers:
+            pool = make_pool(workers)
+            seconds = statistics.median(rerun(counts, pool) for _ in range(args.repeat))
+            if pool is not None:
+                pool.shutdown()
+            sequential = sequential or seconds
+            print(f"{name:>5} {workers:>8} {seconds * 1e3:>9.1f} {sequential / seconds:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
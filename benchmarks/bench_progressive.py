@@ -0,0 +1,76 @@
+"""Benchmark: time to first charts with sample estimates vs. exact aggregations.
+
+Run from the project root:
+
+    python -m benchmarks.bench_progressive --rows 4000000 --sample 10000 50000 200000
+
+For a synthetic cleaned dataset (benchmarks/synthetic.py) and a selection
+on a column outside the cube (weather_conditions, so every chart is a
+group-by over the selected rows), reports the time to compute every chart:
+
+  exact     utils.filters.FilteredView, what the page waits for today
+  sample    utils.sampling.estimate_counts over a stratified sample of
+            --sample rows (time to draw it is reported separately)
+
+and, per sample size, the largest relative error of the estimated KPIs and
+of the per-severity counts of area_severity (Fatal Injury included).
+Median of --repeat runs.
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.synthetic import synthesize
+from utils.aggregations import CHARTS
+from utils.filters import build_bitmaps, selection_counts
+from utils.prep import clean_and_engineer_features
+from utils.sampling import StratifiedSample, estimate_counts
+
+
+def all_charts(counts) -> float:
+    start = time.perf_counter()
+    for chart_id in CHARTS:
+        counts(chart_id)
+    return time.perf_counter() - start
+
+
+def relative_error(estimate, exact) -> float:
+    return abs(estimate - exact) / exact if exact else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=4_000_000)
+    parser.add_argument('--sample', type=int, nargs='+', default=[10_000, 50_000, 200_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = clean_and_engineer_features(synthesize(args.rows))
+    bitmaps = build_bitmaps(df, ['accident_severity', 'area_accident_occured', 'weather_conditions'])
+    selection = {
+        'accident_severity': list(bitmaps['accident_severity']),
+        'weather_conditions': ['Normal', 'Raining'],
+    }
+    exact = selection_counts(selection, None, df, bitmaps)
+    exact_seconds = statistics.median(all_charts(exact) for _ in range(args.repeat))
+    kpis = exact('kpis').iloc[0]
+    by_severity = exact('area_severity').groupby('accident_severity', observed=True)['count'].sum()
+
+    print(f"{args.rows:,} rows; exact, all {len(CHARTS)} charts: {exact_seconds * 1e3:.1f} ms")
+    print(f"{'sample':>8} {'draw ms':>8} {'charts ms':>10} {'speed-up':>9} {'KPI err':>8} {'severity err':>13}")
+    for size in args.sample:
+        start = time.perf_counter()
+        sample = StratifiedSample(df, size)
+        draw = time.perf_counter() - start
+        estimate = estimate_counts(sample, selection, df, bitmaps)
+        seconds = statistics.median(all_charts(estimate) for _ in range(args.repeat))
+        estimated = estimate('kpis').iloc[0]
+        kpi_error = max(relative_error(estimated[k], kpis[k]) for k in ('total', 'avg_casualties', 'critical_rate'))
+        severity = estimate('area_severity').groupby('accident_severity', observed=True)['count'].sum()
+        severity_error = max(relative_error(severity.get(s, 0), n) for s, n in by_severity.items())
+        print(f"{len(sample):>8,} {draw * 1e3:>8.1f} {seconds * 1e3:>10.1f} {exact_seconds / seconds:>8.1f}x "
+              f"{kpi_error:>8.1%} {severity_error:>13.1%}")
+
+
+if __name__ == '__main__':
+    main()
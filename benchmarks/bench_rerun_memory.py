@@ -0,0 +1,92 @@
+"""Benchmark: peak allocation and time of one dashboard rerun's aggregations.
+
+Run from the project root:
+
+    python -m benchmarks.bench_rerun_memory --rows 1000000
+
+Compares, for the same sidebar selection:
+  copy  - the original flow: df_filtered = df[mask].copy(), a copied severe
+          subset (twice, as in sections 4 and 6) and a group-by per chart
+  view  - FilteredView: bitmap row positions over the base frame, severe
+          positions resolved once, only group-by codes gathered
+  cube  - the default path: slices of the precomputed count cube
+Peak allocation is measured with tracemalloc (numpy/pandas buffers).
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from utils.aggregations import CHARTS
+from utils.cube import build_cube, query
+from utils.filters import FilteredView, build_bitmaps, select
+from utils.io import load_data
+from utils.schema import CRITICAL_SEVERITY
+
+DATA_PATH = 'RTA Dataset.csv'
+
+
+def copy_rerun(df, selection):
+    mask = np.ones(len(df), dtype=bool)
+    for col, values in selection.items():
+        mask &= df[col].isin(values).to_numpy()
+    df_filtered = df[mask].copy()
+    for _ in range(2):
+        df_severe = df_filtered[df_filtered['accident_severity'].isin(CRITICAL_SEVERITY)].copy()
+    for chart_id, spec in CHARTS.items():
+        source = df_severe if spec.get('severe') else df_filtered
+        grouped = source.groupby(spec['dims'], observed=True)
+        grouped[spec['measure']].agg(['mean', 'std']) if spec.get('measure') else grouped.size()
+
+
+def view_rerun(df, bitmaps, selection):
+    view = FilteredView(df, select(bitmaps, selection, len(df)))
+    for chart_id in CHARTS:
+        view.counts(chart_id)
+
+
+def cube_rerun(cube, selection):
+    for chart_id in CHARTS:
+        query(cube, chart_id, selection)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--source', default=DATA_PATH)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    base = load_data(args.source)
+    df = base.take(np.resize(np.arange(len(base)), args.rows)).reset_index(drop=True)
+    bitmaps = build_bitmaps(df)
+    cube = build_cube(df)
+    areas = list(bitmaps['area_accident_occured'])
+    selection = {
+        'accident_severity': ['Slight Injury', 'Serious Injury', 'Fatal Injury'],
+        'area_accident_occured': areas[:len(areas) // 2 + 1],
+    }
+
+    print(f"{len(df):,} rows, base frame {df.memory_usage(deep=True).sum() / 1e6:.1f} MB")
+    print(f"{'path':>6} {'seconds':>9} {'peak MB':>9}")
+    for name, func, func_args in [
+        ('copy', copy_rerun, (df, selection)),
+        ('view', view_rerun, (df, bitmaps, selection)),
+        ('cube', cube_rerun, (cube, selection)),
+    ]:
+        seconds, peak = measure(func, *func_args)
+        print(f"{name:>6} {seconds:>9.3f} {peak / 1e6:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark: per-worker memory with private copies vs. the shared Arrow store.
+
+Run from the project root:
+
+    python -m benchmarks.bench_shared --rows 100000 1000000 4000000 --workers 4 --check
+
+For every row count a synthetic dataset (benchmarks/synthetic.py) is ingested
+into a Parquet store (utils.io.ingest_csv_chunked), then --workers processes
+are started at once, as a multi-worker deployment would be. Each builds the
+snapshot the app serves (utils.live.build_snapshot: frame, filter bitmaps,
+count cube and data-quality report):
+
+  private   without RTA_SHARED_DIR: each worker reads the store into its own
+            frame and builds its own bitmaps
+  shared    the frame and bitmaps are published once (utils.shared.attach in
+            the parent, as the first worker would) and every worker maps them
+            read-only
+
+Each worker touches every column and bitmap and reports its private (RssAnon)
+and shared (RssFile + RssShmem) resident memory while all workers are alive.
+With --check the run fails if the private memory of a shared-mode worker grows
+with the dataset size by more than the allowed slack.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import synthesize
+from utils import shared
+from utils.filters import build_bitmaps
+from utils.io import dataset_version, ingest_csv_chunked, load_data
+from utils.live import build_snapshot
+
+
+def rss_mb() -> dict:
+    status = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('RssAnon', 'RssFile', 'RssShmem'):
+                status[key] = int(value.split()[0]) / 1024
+    return {'private_mb': status['RssAnon'], 'shared_mb': status['RssFile'] + status['RssShmem']}
+
+
+def touch(df: pd.DataFrame) -> int:
+    """Reads every value buffer once so all pages are resident, without
+    allocating converted copies (which would show up as private memory)."""
+    total = 0
+    for col in df.columns:
+        array = df[col].array
+        if isinstance(array, pd.Categorical):
+            buffers = [array.codes]
+        elif hasattr(array, '_mask'):
+            buffers = [array._data, array._mask]
+        else:
+            buffers = [np.asarray(array)]
+        for values in buffers:
+            total += int(values.view(np.uint8).sum(dtype=np.uint64))
+    return total
+
+
+def worker(mode: str, store_dir: str, shared_dir: str) -> None:
+    shared.SHARED_DIR = shared_dir if mode == 'shared' else None
+    snapshot = build_snapshot(store_dir, dataset_version(store_dir))
+    touch(snapshot.data)
+    for values in snapshot.bitmaps.values():
+        for bits in values.values():
+            int(bits.sum(dtype=np.uint64))
+    print(json.dumps({'pid': os.getpid(), **rss_mb()}), flush=True)
+    sys.stdin.read()  # stay alive (and attached) until the parent has measured everyone
+
+
+def run_workers(mode: str, store_dir: str, shared_dir: str, workers: int) -> list:
+    command = [sys.executable, '-m', 'benchmarks.bench_shared', '--worker', mode, store_dir, shared_dir]
+    procs = [subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True) for _ in range(workers)]
+    reports = [json.loads(proc.stdout.readline()) for proc in procs]
+    version = dataset_version(store_dir)
+    leases = len(shared.SharedDataset(shared_dir, shared._key(store_dir), version).leases()) if mode == 'shared' else 0
+    for proc in procs:
+        proc.stdin.close()
+        proc.wait()
+    for report in reports:
+        report['leases'] = leases
+    return reports
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        worker(*sys.argv[2:])
+        return
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 4_000_000])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--shared-dir', default='/dev/shm' if os.path.isdir('/dev/shm') else None,
+                        help='parent of the temporary store (default: /dev/shm)')
+    parser.add_argument('--check', action='store_true', help='fail if shared-mode private memory grows with the rows')
+    parser.add_argument('--slack', type=float, default=1.25, help='allowed private memory ratio for --check')
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory(dir=args.shared_dir) as store:
+        print(f"{'rows':>10} {'data MB':>8} {'mode':>8} {'private MB/worker':>18} {'shared MB/worker':>17} {'leases':>7} {'seconds':>8}")
+        for rows in sorted(args.rows):
+            csv_path = os.path.join(tmp, f'rta_{rows}.csv')
+            store_dir = os.path.join(tmp, f'store_{rows}')
+            synthesize(rows).to_csv(csv_path, index=False)
+            ingest_csv_chunked(csv_path, store_dir)
+            os.remove(csv_path)
+            data_mb = load_data(store_dir).memory_usage(deep=True).sum() / 1e6
+            for mode in ('private', 'shared'):
+                started = time.perf_counter()
+                if mode == 'shared':
+                    shared.attach(store_dir, dataset_version(store_dir), lambda: load_data(store_dir),
+                                  store, index=build_bitmaps).release()
+                reports = run_workers(mode, store_dir, store, args.workers)
+                seconds = time.perf_counter() - started
+                private = max(r['private_mb'] for r in reports)
+                shared_mb = max(r['shared_mb'] for r in reports)
+                results[(rows, mode)] = private
+                print(f"{rows:>10,} {data_mb:>8.1f} {mode:>8} {private:>18.1f} {shared_mb:>17.1f} "
+                      f"{reports[0]['leases']:>7} {seconds:>8.2f}")
+
+    if args.check:
+        smallest, largest = min(args.rows), max(args.rows)
+        ratio = results[(largest, 'shared')] / results[(smallest, 'shared')]
+        print(f"shared-mode private memory {largest:,} vs {smallest:,} rows: x{ratio:.2f} (allowed x{args.slack})")
+        if ratio > args.slack:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: cold-start time of app.py, by startup phase.
+
+Run from the project root:
+
+    python -m benchmarks.bench_startup --rows 12316 1000000 --repeat 3
+
+For each row count a synthetic raw CSV (benchmarks/synthetic.py) is written
+as "RTA Dataset.csv" in a temporary directory, next to copies of the sidebar
+images, and app.py is run there in a fresh Python process per measurement
+(streamlit.testing AppTest, which imports Streamlit first, as the server
+does). The first run in each process reports its phases through
+RTA_STARTUP_FILE (see utils.perf.StartupReport):
+
+  empty   no on-disk caches: the CSV is cleaned and the images resized
+  warm    a new process with the Parquet cache and resized images on disk,
+          i.e. a server restart
+
+"shell" is the time until the page shell is on screen (assets + shell);
+median of --repeat processes.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.synthetic import synthesize
+from utils.perf import STARTUP_PHASES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIDEBAR_IMAGES = ["微信图片_20251123203603_26_25.jpg", "微信图片_20251123203604_27_25.jpg"]
+
+
+def worker() -> None:
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=600)
+    at.run()
+    if at.exception:
+        raise SystemExit(at.exception[0].value)
+
+
+def start(workdir: str) -> dict:
+    report = os.path.join(workdir, 'startup.json')
+    env = {**os.environ, 'RTA_STARTUP_FILE': report, 'RTA_WATCH_INTERVAL': '0', 'PYTHONPATH': ROOT}
+    subprocess.run([sys.executable, '-m', 'benchmarks.bench_startup', '--worker'],
+                   cwd=workdir, env=env, check=True, capture_output=True)
+    with open(report, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        worker()
+        return
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[12_316, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'cache':>6} {'shell s':>8} " + ' '.join(f'{phase:>7}' for phase in STARTUP_PHASES) + f" {'total s':>8}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as workdir:
+            synthesize(rows).to_csv(os.path.join(workdir, 'RTA Dataset.csv'), index=False)
+            for image in SIDEBAR_IMAGES:
+                shutil.copy(os.path.join(ROOT, image), workdir)
+            for cache in ('empty', 'warm'):
+                reports = []
+                for _ in range(args.repeat):
+                    if cache == 'empty':
+                        shutil.rmtree(os.path.join(workdir, 'data'), ignore_errors=True)
+                    reports.append(start(workdir))
+                phases = {phase: statistics.median(r['phases'].get(phase, 0.0) for r in reports) for phase in STARTUP_PHASES}
+                shell = statistics.median(r['phases']['assets'] + r['phases']['shell'] for r in reports)
+                total = statistics.median(r['total'] for r in reports)
+                print(f"{rows:>10,} {cache:>6} {shell:>8.3f} " + ' '.join(f'{phases[p]:>7.3f}' for p in STARTUP_PHASES) + f" {total:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
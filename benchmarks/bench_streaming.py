@@ -0,0 +1,81 @@
+"""Benchmark: peak memory of the chunked streaming ingest vs. input size.
+
+Run from the project root:
+
+    python -m benchmarks.bench_streaming --rows 250000 1000000 4000000 --check
+
+'RTA Dataset.csv' is tiled up to each row count into a temporary CSV, which is
+then ingested by `python -m utils.io` in a fresh process so every run reports
+its own peak RSS. With --check the run fails if peak RSS of the largest input
+exceeds that of the smallest by more than the allowed slack, i.e. memory must
+be bounded by the chunk size rather than by the file size. The duplicate
+tracking of the quality profile is the exception: it keeps up to 16 bytes per
+distinct row (utils.quality.QualityProfile). The tiled input repeats the same
+~12k distinct rows, so it is constant here; on data without duplicates it
+adds ~8 bytes per row.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pandas as pd
+
+from utils.io import STORE_MANIFEST
+
+DATA_PATH = 'RTA Dataset.csv'
+
+
+def write_tiled_csv(source: str, rows: int, out: str) -> None:
+    base = pd.read_csv(source, dtype=str, keep_default_na=False)
+    written = 0
+    with open(out, 'w', encoding='utf-8', newline='') as f:
+        while written < rows:
+            part = base.iloc[:rows - written]
+            part.to_csv(f, index=False, header=written == 0)
+            written += len(part)
+
+
+def ingest(csv_path: str, store_dir: str, chunksize: int) -> dict:
+    subprocess.run(
+        [sys.executable, '-m', 'utils.io', csv_path, '--store', store_dir, '--chunksize', str(chunksize), '--trace-memory'],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+    with open(os.path.join(store_dir, STORE_MANIFEST), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--source', default=DATA_PATH)
+    parser.add_argument('--rows', type=int, nargs='+', default=[250_000, 1_000_000, 4_000_000])
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--check', action='store_true', help='fail if peak RSS grows with the input size')
+    parser.add_argument('--slack', type=float, default=1.25, help='allowed peak RSS ratio for --check')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'rows':>12} {'csv MB':>8} {'parts':>6} {'seconds':>8} {'traced MB':>10} {'peak RSS MB':>12}")
+        for rows in sorted(args.rows):
+            csv_path = os.path.join(tmp, f'rta_{rows}.csv')
+            write_tiled_csv(args.source, rows, csv_path)
+            stats = ingest(csv_path, os.path.join(tmp, f'store_{rows}'), args.chunksize)
+            results.append(stats)
+            print(f"{rows:>12,} {os.path.getsize(csv_path) / 1e6:>8.1f} {stats['parts']:>6} {stats['seconds']:>8.2f} "
+                  f"{stats['peak_traced_bytes'] / 1e6:>10.1f} {(stats['peak_rss_bytes'] or float('nan')) / 1e6:>12.1f}")
+            os.remove(csv_path)
+
+    if args.check and len(results) > 1:
+        if results[0]['peak_rss_bytes'] is None:
+            sys.exit("--check needs the peak RSS, which this platform does not report")
+        ratio = results[-1]['peak_rss_bytes'] / results[0]['peak_rss_bytes']
+        if ratio > args.slack:
+            sys.exit(f"FAIL: peak RSS grew {ratio:.2f}x from {results[0]['rows']:,} to {results[-1]['rows']:,} rows")
+        print(f"OK: peak RSS ratio {ratio:.2f}x (limit {args.slack}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""Benchmark suite: ingest, cleaning, sidebar filtering, every chart aggregation
+and the data-quality report on synthetic RTA data.
+
+Run from the project root:
+
+    python -m benchmarks.bench_suite --rows 10000 100000 1000000 10000000
+    python -m benchmarks.bench_suite --rows 10000 100000 --check
+
+For each size a CSV is synthesized from the category distributions in
+cleaned.csv (see benchmarks/synthetic.py) and these stages are timed:
+
+  load_data_cold     utils.io.load_data on a fresh cache (parse, clean, write Parquet)
+  load_data_warm     utils.io.load_data served from the Parquet cache
+  read_raw_csv       parsing the CSV only
+  clean              utils.prep.clean_and_engineer_features
+  filter_index       building the sidebar bitmaps
+  sidebar_filter     bitmap selection plus the Serious/Fatal positions of the view
+  build_cube         the pre-aggregated count cube
+  cube:<chart>       every chart/KPI served from the cube (overview: kpis)
+  rows:<chart>       every chart/KPI aggregated from the filtered rows
+  quality_report     the data-quality section
+
+Results are written to --out as JSON (one record per size and stage). When
+the baseline file exists each stage is compared against it; --check fails
+if any stage is slower than the baseline by more than --slack.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import write_csv
+from utils.aggregations import CHARTS, aggregate_rows
+from utils.cube import build_cube, query
+from utils.filters import FilteredView, build_bitmaps, select
+from utils.io import load_data, read_raw_csv
+from utils.prep import clean_and_engineer_features
+from utils.quality import quality_report
+
+RESULTS_PATH = os.path.join('benchmarks', 'results.json')
+BASELINE_PATH = os.path.join('benchmarks', 'baseline.json')
+
+
+def best_of(repeat: int, func, *args):
+    """Smallest wall time of `repeat` calls, and the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def default_selection(bitmaps: dict) -> dict:
+    """Two of three severities and half of the areas, as a typical sidebar state."""
+    areas = list(bitmaps['area_accident_occured'])
+    return {
+        'accident_severity': ['Slight Injury', 'Serious Injury'],
+        'area_accident_occured': areas[:len(areas) // 2 + 1],
+    }
+
+
+def run_size(rows: int, tmp: str, repeat: int) -> list:
+    csv_path = os.path.join(tmp, f'rta_{rows}.csv')
+    cache_dir = os.path.join(tmp, f'cache_{rows}')
+    write_csv(rows, csv_path)
+    timings = {}
+
+    def load_cold():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return load_data(csv_path, cache_dir)
+    timings['load_data_cold'], df = best_of(repeat, load_cold)
+    timings['load_data_warm'], df = best_of(repeat, load_data, csv_path, cache_dir)
+    # Cleaning renames and converts columns in place, so every run cleans
+    # the frame parsed just before it.
+    timings['read_raw_csv'] = timings['clean'] = float('inf')
+    for _ in range(repeat):
+        seconds, raw = best_of(1, read_raw_csv, csv_path)
+        timings['read_raw_csv'] = min(timings['read_raw_csv'], seconds)
+        seconds, _ = best_of(1, clean_and_engineer_features, raw)
+        timings['clean'] = min(timings['clean'], seconds)
+        del raw
+    os.remove(csv_path)
+
+    timings['filter_index'], bitmaps = best_of(repeat, build_bitmaps, df)
+    selection = default_selection(bitmaps)
+
+    def filter_rows():
+        view = FilteredView(df, select(bitmaps, selection, len(df)))
+        view.severe_rows
+        return view
+    timings['sidebar_filter'], view = best_of(repeat, filter_rows)
+
+    timings['build_cube'], cube = best_of(repeat, build_cube, df)
+    for chart_id in CHARTS:
+        timings[f'cube:{chart_id}'], _ = best_of(repeat, query, cube, chart_id, selection)
+        timings[f'rows:{chart_id}'], _ = best_of(
+            repeat, aggregate_rows, df, chart_id, view.rows, view.severe_rows)
+
+    timings['quality_report'], _ = best_of(repeat, quality_report, df)
+    return [{'rows': rows, 'stage': stage, 'seconds': seconds} for stage, seconds in timings.items()]
+
+
+def environment() -> dict:
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(results: list, baseline: list, min_seconds: float) -> pd.DataFrame:
+    """Current vs. baseline seconds per (rows, stage) present in both."""
+    current = pd.DataFrame(results).set_index(['rows', 'stage'])['seconds']
+    base = pd.DataFrame(baseline).set_index(['rows', 'stage'])['seconds']
+    table = pd.DataFrame({'baseline': base, 'current': current}).dropna()
+    # Stages faster than min_seconds in both runs are timer noise.
+    table['ratio'] = (table['current'].clip(lower=min_seconds) / table['baseline'].clip(lower=min_seconds))
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--repeat', type=int, default=5, help='runs per stage (best is kept)')
+    parser.add_argument('--out', default=RESULTS_PATH)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='also write the results to --baseline')
+    parser.add_argument('--check', action='store_true', help='fail if a stage is slower than the baseline')
+    parser.add_argument('--slack', type=float, default=1.5, help='allowed current/baseline ratio for --check')
+    parser.add_argument('--min-seconds', type=float, default=0.02, help='timings below this are treated as equal')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sorted(args.rows):
+            size_results = run_size(rows, tmp, args.repeat)
+            results.extend(size_results)
+            print(f"{rows:>12,} rows")
+            for r in size_results:
+                print(f"    {r['stage']:<32} {r['seconds']:>9.4f}s")
+
+    report = {'environment': environment(), 'results': results}
+    for path in [args.out] + ([args.baseline] if args.save_baseline else []):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+    print(f"Results written to {args.out}")
+
+    if args.save_baseline or not os.path.exists(args.baseline):
+        return
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    table = compare(results, baseline['results'], args.min_seconds)
+    if table.empty:
+        print(f"No stages in common with {args.baseline}")
+        return
+    slower = table[table['ratio'] > args.slack]
+    print(f"\nAgainst {args.baseline} ({baseline['environment']['timestamp']}): "
+          f"median ratio {table['ratio'].median():.2f}x, {len(slower)} stage(s) over {args.slack}x")
+    if len(slower):
+        print(slower.to_string(float_format=lambda v: f'{v:.4f}'))
+    if args.check and len(slower):
+        sys.exit(f"FAIL: {len(slower)} stage(s) slower than the baseline by more than {args.slack}x")
+
+
+if __name__ == '__main__':
+    main()
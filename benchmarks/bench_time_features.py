@@ -0,0 +1,61 @@
+"""Benchmark: per-row datetime.time parsing vs. the vectorized time-feature stage.
+
+Run from the project root:
+
+    python -m benchmarks.bench_time_features --rows 12316 10000000
+
+The `time` column of 'RTA Dataset.csv' is tiled up to each row count (random
+H:MM:SS strings are used when the CSV is not available).
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.prep import add_time_features
+
+DATA_PATH = 'RTA Dataset.csv'
+
+
+def legacy_time_features(df: pd.DataFrame) -> pd.DataFrame:
+    """The original ingest step: Python time objects plus a per-row apply."""
+    df['time'] = pd.to_datetime(df['time'], format='%H:%M:%S', errors='coerce').dt.time
+    df['hour'] = df['time'].apply(lambda x: x.hour if pd.notna(x) else np.nan)
+    return df
+
+
+def time_strings(rows: int) -> pd.Series:
+    if os.path.exists(DATA_PATH):
+        base = pd.read_csv(DATA_PATH, usecols=['Time'])['Time']
+    else:
+        rng = np.random.default_rng(0)
+        base = pd.Series([f"{h}:{m:02d}:00" for h, m in zip(rng.integers(0, 24, 12316), rng.integers(0, 60, 12316))])
+    return pd.Series(np.resize(base.to_numpy(dtype=object), rows), name='time')
+
+
+def timed(func, df: pd.DataFrame):
+    start = time.perf_counter()
+    out = func(df)
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[12316, 10_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'legacy s':>10} {'vector s':>10} {'speedup':>8} {'legacy MB':>10} {'vector MB':>10}")
+    for rows in args.rows:
+        strings = time_strings(rows)
+        legacy_s, legacy = timed(legacy_time_features, strings.to_frame())
+        vector_s, vector = timed(add_time_features, strings.to_frame())
+        assert (legacy['hour'].fillna(-1).to_numpy() == vector['hour'].fillna(-1).to_numpy()).all()
+        legacy_mb = legacy.memory_usage(deep=True).sum() / 1e6
+        vector_mb = vector.memory_usage(deep=True).sum() / 1e6
+        print(f"{rows:>12,} {legacy_s:>10.3f} {vector_s:>10.3f} {legacy_s / vector_s:>7.1f}x {legacy_mb:>10.1f} {vector_mb:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
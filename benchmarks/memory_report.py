@@ -0,0 +1,33 @@
+"""Memory report: bytes per column of a plain read_csv vs. the schema-typed frame.
+
+Run from the project root:
+
+    python -m benchmarks.memory_report [path/to/RTA Dataset.csv]
+"""
+import sys
+
+import pandas as pd
+
+from utils.io import read_raw_csv
+from utils.prep import clean_and_engineer_features, normalize_columns
+from utils.schema import memory_report
+
+DATA_PATH = 'RTA Dataset.csv'
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DATA_PATH
+    before = pd.read_csv(path)
+    before.columns = normalize_columns(before.columns)
+    after = clean_and_engineer_features(read_raw_csv(path))
+    report = memory_report(before, after)
+    with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', 160):
+        print(report)
+    total_before = report['bytes_before'].sum()
+    total_after = report['bytes_after'].sum()
+    print(f"\n{len(after):,} rows: {total_before / 1e6:.1f} MB -> {total_after / 1e6:.1f} MB "
+          f"({total_before / total_after:.1f}x smaller)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""RTA-shaped synthetic data drawn from the category distributions in cleaned.csv.
+
+cleaned.csv holds 15 label columns of the real dataset. Whole rows are
+resampled with replacement, so both the per-column frequencies and the
+co-occurrence of values (e.g. cause vs. severity) match the real data.
+Accident_severity is label-encoded there (0/1/2, alphabetical order) and is
+mapped back to its labels.
+
+The columns the dashboard needs that cleaned.csv does not carry (Time,
+Day_of_week, Area_accident_occured, Number_of_vehicles_involved,
+Number_of_casualties) are drawn uniformly from their raw value ranges.
+Output uses the raw CSV headers so it goes through read_raw_csv / cleaning
+exactly like 'RTA Dataset.csv'.
+"""
+import numpy as np
+import pandas as pd
+
+from utils.schema import DAYS_OF_WEEK
+
+CLEANED_PATH = 'cleaned.csv'
+
+# LabelEncoder order of Accident_severity in cleaned.csv.
+SEVERITY_LABELS = ['Fatal Injury', 'Serious Injury', 'Slight Injury']
+AREAS = [
+    'Residential areas', 'Office areas', '  Recreational areas', ' Industrial areas', 'Other',
+    'Church areas', 'Hospital areas', 'Unknown', 'School areas', '  Market areas',
+    'Rural village areas', ' Outside rural areas',
+]
+# Every H:MM:SS of a day, as written in the raw CSV.
+TIMES = [f'{s // 3600}:{s // 60 % 60:02d}:{s % 60:02d}' for s in range(24 * 3600)]
+CHUNK_ROWS = 1_000_000
+
+
+def load_distributions(path: str = CLEANED_PATH) -> pd.DataFrame:
+    """cleaned.csv with every column as a categorical (resampled by code)."""
+    cleaned = pd.read_csv(path, dtype=str, keep_default_na=False)
+    codes = cleaned['Accident_severity'].astype(int)
+    cleaned['Accident_severity'] = pd.Categorical.from_codes(codes, SEVERITY_LABELS)
+    return cleaned.astype('category')
+
+
+def synthesize(rows: int, seed: int = 0, source: pd.DataFrame = None) -> pd.DataFrame:
+    """`rows` synthetic raw RTA rows."""
+    source = load_distributions() if source is None else source
+    rng = np.random.default_rng(seed)
+    df = source.take(rng.integers(0, len(source), rows)).reset_index(drop=True)
+    df.insert(0, 'Time', pd.Categorical.from_codes(rng.integers(0, len(TIMES), rows), TIMES))
+    df.insert(1, 'Day_of_week', pd.Categorical.from_codes(rng.integers(0, 7, rows), DAYS_OF_WEEK))
+    df['Area_accident_occured'] = pd.Categorical.from_codes(rng.integers(0, len(AREAS), rows), AREAS)
+    df['Number_of_vehicles_involved'] = rng.integers(1, 8, rows).astype(np.uint8)
+    df['Number_of_casualties'] = rng.integers(1, 9, rows).astype(np.uint8)
+    return df
+
+
+def write_csv(rows: int, out: str, seed: int = 0) -> None:
+    """Writes `rows` synthetic rows to `out` in chunks, so memory stays bounded."""
+    source = load_distributions()
+    written = 0
+    with open(out, 'w', encoding='utf-8', newline='') as f:
+        while written < rows:
+            n = min(CHUNK_ROWS, rows - written)
+            synthesize(n, seed + written, source).to_csv(f, index=False, header=written == 0)
+            written += n
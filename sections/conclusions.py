@@ -1,12 +1,12 @@
 import streamlit as st
 
-def show():
-    st.header("7. 💡 Insights & Next Steps")
-    st.markdown("""
+def show(ui=st):
+    ui.header("7. 💡 Insights & Next Steps")
+    ui.markdown("""
 Based on the in-depth analysis across five dimensions, we can identify key risk factors contributing to severe traffic accidents, providing clear direction for traffic safety policy development.
 """)
-    st.subheader("Key Insights")
-    st.success(
+    ui.subheader("Key Insights")
+    ui.success(
         """
         **1. Risk Concentration by Area:**
         * **High-risk areas** (`Office areas`, `Residential areas`) show not only high total accident volumes but also a significantly higher proportion of **'Vehicle with vehicle collision'**, suggesting inadequate traffic management and flow in these areas during peak hours.
@@ -27,8 +27,8 @@ Based on the in-depth analysis across five dimensions, we can identify key risk
         * The **Age-Experience Heatmap** clearly identifies the combination of **18-30 year-old** drivers with **2-5 years of experience** as the **primary hotspot** for severe accidents, designating young and moderately experienced drivers as the priority target for intervention.
         """
     )
-    st.subheader("Next Steps and Recommendations")
-    st.markdown(
+    ui.subheader("Next Steps and Recommendations")
+    ui.markdown(
         """
         Based on the data insights above, we recommend implementing the following three targeted actions:
         
@@ -46,5 +46,5 @@ Based on the in-depth analysis across five dimensions, we can identify key risk
             * **Basic Education:** Consider offering free or mandatory **traffic rule reinforcement courses** for drivers with lower educational backgrounds or specific experience ranges to improve their risk identification and avoidance skills.
         """
     )
-    st.markdown("---")
-    st.markdown("Created for #EFREIDataStoriesWUT2025 | Data Visualization Project")
+    ui.markdown("---")
+    ui.markdown("Created for #EFREIDataStoriesWUT2025 | Data Visualization Project")
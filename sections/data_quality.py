@@ -0,0 +1,48 @@
+import streamlit as st
+import altair as alt
+
+from utils import perf
+from utils.i18n import text
+from utils.viz import chart_template, draw_template
+
+@chart_template('missing_top', "Top Columns by Missing Percentage")
+def missing_top_chart(data):
+    return alt.Chart(data).mark_bar(color='#CC6666').encode(
+        x=alt.X('missing_pct:Q', title='Missing %'),
+        y=alt.Y('column:N', title='Column', sort=alt.SortField('missing_pct', order='descending')),
+        tooltip=[alt.Tooltip('missing_count:Q', title='Missing count'), alt.Tooltip('missing_pct:Q', title='Missing %')]
+    ).properties(height=400)
+
+def show(report, ui=st):
+    """Data Quality & Missingness Report. `report` is QualityProfile.report()
+    (or utils.quality.quality_report) for the whole dataset."""
+    ui.header("Data Quality & Missingness Report")
+    ui.info("Summary of missing values, duplicates, and simple validation checks. Review before using the analysis results.")
+
+    # Missing values per column
+    missing = report['missing']
+    ui.subheader("Missing Values by Column")
+    ui.write(text(ui, "Total rows: {rows:,}", rows=report['rows']))
+    with perf.timed('render', 'missing table'):
+        ui.table(missing)
+
+    # Show a compact bar chart of top columns with missingness
+    top_missing = missing[missing['missing_count'] > 0].head(20)
+    if not top_missing.empty:
+        draw_template('missing_top', top_missing, ui)
+    else:
+        ui.success("No missing values detected in the dataset.")
+
+    # Duplicate rows check
+    dup_count = report['duplicate_count']
+    ui.subheader("Duplicate Rows")
+    ui.write(text(ui, "Duplicate rows detected: {count}", count=dup_count))
+    if dup_count > 0:
+        ui.write(text(ui, "Distinct rows repeated: {count}", count=report['duplicate_groups']))
+        ui.write("Preview of duplicate rows:")
+        ui.dataframe(report['duplicate_preview'])
+
+    # Simple row-level missingness distribution (how many rows have N missing cols)
+    ui.subheader("Row-level Missingness Distribution")
+    with perf.timed('render', 'row missingness chart'):
+        ui.bar_chart(report['row_missing'].set_index('missing_cols_count'))
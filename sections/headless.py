@@ -0,0 +1,73 @@
+"""Runs the dashboard sections without a Streamlit server.
+
+    python -m sections.headless --out build/headless
+    python -m sections.headless --selection '{"accident_severity": ["Fatal Injury"]}'
+    python -m sections.headless --lang zh
+
+The same show() functions app.py calls are run against a
+utils.headless.HeadlessUI, which records every aggregate, chart spec and
+text element. The result is written to --out (page.json, charts/<id>.vl.json,
+aggregates/*.csv) for pre-rendering, batch benchmarks and regression diffs.
+"""
+import argparse
+import json
+import time
+
+import pandas as pd
+
+from sections import conclusions, data_quality, deep_dives, intro, overview
+from utils.cube import build_cube
+from utils.filters import SIDEBAR_FILTERS, build_bitmaps, selection_counts
+from utils.headless import HeadlessUI
+from utils.i18n import LANGUAGES, LocalizedUI
+from utils.io import load_data
+from utils.memo import frozen_counts
+from utils.quality import quality_report
+
+DATA_PATH = 'RTA Dataset.csv'
+
+
+def render(counts, ui: HeadlessUI = None, report: dict = None) -> HeadlessUI:
+    """Runs every section against `ui` and returns it with the page recorded.
+    The data-quality section is included when its `report` is given. `ui` may
+    be a HeadlessUI wrapped in utils.i18n.LocalizedUI."""
+    ui = ui or HeadlessUI()
+    counts = ui.record(frozen_counts(counts))
+    intro.show(ui=ui)
+    overview.show(counts, ui=ui)
+    deep_dives.show(counts, ui=ui)
+    if report is not None:
+        data_quality.show(report, ui=ui)
+    conclusions.show(ui=ui)
+    return ui
+
+
+def render_dataset(df: pd.DataFrame, selection: dict = None, lang: str = 'en') -> HeadlessUI:
+    """Renders the page for `df` in `lang`. The selection defaults to the
+    sidebar's default state (every value of every filter); it may also
+    filter columns that have no sidebar widget."""
+    columns = [f['column'] for f in SIDEBAR_FILTERS]
+    bitmaps = build_bitmaps(df, columns + [c for c in selection or {} if c not in columns])
+    if selection is None:
+        selection = {col: list(bitmaps[col]) for col in columns}
+    counts = selection_counts(selection, build_cube(df), df, bitmaps)
+    return render(counts, LocalizedUI(HeadlessUI(), lang), quality_report(df))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--selection', type=json.loads, help='JSON {column: [values]}; default: everything')
+    parser.add_argument('--out', default='build/headless')
+    parser.add_argument('--lang', default='en', choices=list(LANGUAGES))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    ui = render_dataset(load_data(args.data), args.selection, args.lang)
+    ui.write_to(args.out)
+    print(f"{len(ui.charts)} charts, {len(ui.aggregates)} aggregates written to {args.out} "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""The report's sections as navigation entries, for app.py's section view.
+
+Every entry lists the chart ids (utils.aggregations.CHARTS) its section
+draws, so only those aggregations are scheduled when it is the one on
+screen, and renders through show(page_id, counts, report, ui). `report` is
+a callable returning the data-quality report, so it is only built for the
+section that shows it.
+"""
+import streamlit as st
+
+from sections import conclusions, data_quality, deep_dives, intro, overview
+
+PAGES = {
+    'intro': {
+        'label': "1. 🚨 Project Narrative: From Problem to Analysis Framework",
+        'charts': [],
+        'show': lambda counts, report, ui: intro.show(ui),
+    },
+    'kpis': {
+        'label': "KPI & High-Level Trends",
+        'charts': ['kpis'],
+        'show': lambda counts, report, ui: overview.show(counts, ui),
+    },
+    'geographic': {
+        'label': "2. 🗺️ Geographic Accident Comparison",
+        'charts': ['area_severity', 'area_collision'],
+        'show': lambda counts, report, ui: deep_dives.geographic(counts, ui),
+    },
+    'temporal': {
+        'label': "3. ⏱️ Temporal Accident Analysis",
+        'charts': ['hour_severity', 'hour_collision'],
+        'show': lambda counts, report, ui: deep_dives.temporal(counts, ui),
+    },
+    'factors': {
+        'label': "4.Factor Analysis: Contributing Factors",
+        'charts': ['age_severe', 'experience_severe', 'sex_severe', 'weather_surface', 'cause_severity'],
+        'show': lambda counts, report, ui: deep_dives.factors(counts, ui),
+    },
+    'collisions': {
+        'label': "5. 💥 Collision Type and Casualty Relationship",
+        'charts': ['collision_top5', 'collision_severity', 'collision_casualties'],
+        'show': lambda counts, report, ui: deep_dives.collisions(counts, ui),
+    },
+    'driver': {
+        'label': "6. 👤 Driver Feature and Accident Severity Correlation",
+        'charts': ['education_severity', 'experience_age_severe'],
+        'show': lambda counts, report, ui: deep_dives.driver(counts, ui),
+    },
+    'data_quality': {
+        'label': "Data Quality & Missingness Report",
+        'charts': [],
+        'show': lambda counts, report, ui: data_quality.show(report(), ui),
+    },
+    'conclusions': {
+        'label': "7. 💡 Insights & Next Steps",
+        'charts': [],
+        'show': lambda counts, report, ui: conclusions.show(ui),
+    },
+}
+
+def show(page_id: str, counts, report, ui=st):
+    """Renders one section; `counts` and `ui` as for the section modules."""
+    PAGES[page_id]['show'](counts, report, ui)
@@ -0,0 +1,209 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.schema import CRITICAL_SEVERITY, VALUE_RANGES
+
+# Every aggregation the dashboard draws, keyed by chart id.
+#   dims:    group-by columns of the chart
+#   severe:  computed over Serious/Fatal accidents only
+#   name:    name of the count column handed to the chart
+#   top:     (column, n) keep only the n largest values of column
+#   head:    keep the n largest groups
+#   measure: numeric column summarised with mean/std per group
+#   max_values: {column: n} at most n distinct values shipped (numeric columns
+#            with a VALUE_RANGES entry are always binned on that range's grid,
+#            others keep their n - 1 largest values plus 'Other')
+CHARTS = {
+	'kpis': {'dims': ['accident_severity'], 'measure': 'casualty_count'},
+	'area_severity': {'dims': ['area_accident_occured', 'accident_severity']},
+	'area_collision': {'dims': ['area_accident_occured', 'type_of_collision']},
+	'hour_severity': {'dims': ['hour', 'accident_severity']},
+	'hour_collision': {'dims': ['hour', 'type_of_collision'], 'top': ('type_of_collision', 5), 'max_values': {'hour': 12}},
+	'age_severe': {'dims': ['age_band_of_driver'], 'severe': True, 'name': 'Severe_Count'},
+	'experience_severe': {'dims': ['driving_experience'], 'severe': True, 'name': 'Severe_Count'},
+	'sex_severe': {'dims': ['sex_of_driver'], 'severe': True, 'name': 'Severe_Count'},
+	'weather_surface': {'dims': ['weather_conditions', 'road_surface_type']},
+	'cause_severity': {'dims': ['cause_of_accident', 'accident_severity'], 'top': ('cause_of_accident', 10)},
+	'collision_top5': {'dims': ['type_of_collision'], 'name': 'Count', 'head': 5},
+	'collision_severity': {'dims': ['type_of_collision', 'accident_severity']},
+	'collision_casualties': {'dims': ['type_of_collision'], 'measure': 'casualty_count'},
+	'education_severity': {'dims': ['educational_level', 'accident_severity']},
+	'experience_age_severe': {'dims': ['driving_experience', 'age_band_of_driver'], 'severe': True, 'name': 'Severe_Count'},
+}
+
+# Columns produced by rollup() besides the group keys.
+COUNT = 'count'
+MOMENTS = ['n', 'sum', 'sumsq']
+# Payload budget: no chart ships more rows than this to the browser.
+MAX_CHART_ROWS = int(os.environ.get('RTA_CHART_MAX_ROWS', 1000))
+OTHER = 'Other'
+
+def rollup(df: pd.DataFrame, keys: list, measure: str = None, rows: np.ndarray = None, weights: np.ndarray = None, na_keys: list = ()) -> pd.DataFrame:
+	"""Row count per observed combination of `keys` (NaN keys dropped), plus
+	the non-null count, sum and sum of squares of `measure` when given.
+
+	Groups on category codes with np.bincount. `rows` restricts the rollup to
+	those row positions; only the key codes and the measure are gathered, the
+	frame itself is never copied. With `weights` (one per row of `rows`, or
+	of `df`) every row counts that many times, as for a weighted sample;
+	counts and moments are then floats. NaN values of the keys in `na_keys`
+	are kept as a group of their own instead of being dropped.
+	"""
+	def gather(values):
+		return values if rows is None else values[rows]
+	codes, shape, decoders = [], [], []
+	for key in keys:
+		s = df[key]
+		if isinstance(s.dtype, pd.CategoricalDtype):
+			key_codes, n_values = gather(s.cat.codes.to_numpy()), len(s.cat.categories)
+			decode = lambda idx, dtype=s.dtype: pd.Categorical.from_codes(idx, dtype=dtype)
+		else:
+			key_codes, uniques = pd.factorize(gather(s.array), sort=True)
+			n_values = len(uniques)
+			decode = lambda idx, uniques=uniques: uniques.take(idx, allow_fill=True)
+		if key in na_keys:
+			# NaN (code -1) becomes one extra group, decoded back to NaN.
+			key_codes = np.where(key_codes < 0, n_values, key_codes)
+			decode = lambda idx, decode=decode, n_values=n_values: decode(np.where(idx == n_values, -1, idx))
+			n_values += 1
+		codes.append(key_codes)
+		shape.append(n_values)
+		decoders.append(decode)
+	valid = np.ones(len(df) if rows is None else len(rows), dtype=bool)
+	for key_codes in codes:
+		valid &= key_codes >= 0
+	if codes:
+		flat = np.ravel_multi_index([key_codes[valid] for key_codes in codes], shape)
+	else:
+		flat = np.zeros(int(valid.sum()), dtype=np.intp)
+	n_cells = int(np.prod(shape))
+	row_weights = None if weights is None else weights[valid]
+	count = np.bincount(flat, weights=row_weights, minlength=n_cells)
+	cells = np.flatnonzero(count)
+	positions = np.unravel_index(cells, shape) if codes else []
+	out = {key: decode(idx) for key, decode, idx in zip(keys, decoders, positions)}
+	out[COUNT] = count[cells]
+	if measure:
+		values = gather(df[measure].to_numpy(dtype='float64', na_value=np.nan))[valid]
+		present = ~np.isnan(values)
+		values = np.where(present, values, 0.0)
+		weighted = values if row_weights is None else values * row_weights
+		if row_weights is None:
+			out['n'] = np.bincount(flat, weights=present, minlength=n_cells)[cells].astype(np.int64)
+		else:
+			out['n'] = np.bincount(flat, weights=present * row_weights, minlength=n_cells)[cells]
+		out['sum'] = np.bincount(flat, weights=weighted, minlength=n_cells)[cells]
+		out['sumsq'] = np.bincount(flat, weights=weighted * values, minlength=n_cells)[cells]
+	return pd.DataFrame(out)
+
+def regroup(rolled: pd.DataFrame, keys: list, dropna: bool = True) -> pd.DataFrame:
+	"""Sums an existing rollup down to a subset of its keys (groups with a
+	NaN key are dropped unless `dropna` is False)."""
+	values = [c for c in [COUNT] + MOMENTS if c in rolled.columns]
+	return rolled.groupby(keys, observed=True, dropna=dropna)[values].sum().reset_index()
+
+def aggregate_rows(df: pd.DataFrame, chart_id: str, rows: np.ndarray = None, severe_rows: np.ndarray = None, weights: np.ndarray = None) -> pd.DataFrame:
+	"""Computes a chart's data directly from rows: either an already filtered
+	frame, or the base frame plus row positions (see utils.filters.FilteredView,
+	which also supplies the precomputed Serious/Fatal positions). `weights`
+	are passed to rollup() (sample estimates, see utils/sampling.py); they
+	cannot be combined with `severe_rows`."""
+	spec = CHARTS[chart_id]
+	if spec.get('severe'):
+		if severe_rows is None:
+			positions = np.arange(len(df)) if rows is None else rows
+			severe = df['accident_severity'].take(positions).isin(CRITICAL_SEVERITY).to_numpy()
+			severe_rows = positions[severe]
+			if weights is not None:
+				weights = weights[severe]
+		rows = severe_rows
+	return finalize(chart_id, rollup(df, spec['dims'], spec.get('measure'), rows, weights))
+
+def finalize(chart_id: str, rolled: pd.DataFrame, max_rows: int = MAX_CHART_ROWS) -> pd.DataFrame:
+	"""Turns a rollup over exactly the chart's dims into the frame the chart
+	draws, reduced to the chart's payload budget (see fit_budget)."""
+	spec = CHARTS[chart_id]
+	if chart_id == 'kpis':
+		return _kpis(rolled)
+	if spec.get('measure'):
+		return _mean_std(fit_budget(rolled, spec['dims'], max_rows, spec.get('max_values')), spec['dims'])
+	out = rolled[spec['dims'] + [COUNT]]
+	if 'top' in spec:
+		col, n = spec['top']
+		top = out.groupby(col, observed=True)[COUNT].sum().nlargest(n).index
+		out = out[out[col].isin(top)]
+	if 'head' in spec:
+		out = out.sort_values(COUNT, ascending=False, kind='stable').head(spec['head'])
+	out = fit_budget(out, spec['dims'], max_rows, spec.get('max_values'))
+	return out.rename(columns={COUNT: spec.get('name', COUNT)}).reset_index(drop=True)
+
+def fit_budget(rolled: pd.DataFrame, dims: list, max_rows: int, max_values: dict = None) -> pd.DataFrame:
+	"""Pre-aggregates a rollup until it has at most `max_rows` rows and every
+	column in `max_values` at most that many distinct values.
+
+	Counts and moments are summed, so means/stds computed afterwards stay
+	exact for the coarser groups. Numeric `max_values` columns with a known
+	range (schema.VALUE_RANGES) are binned first, on a grid anchored to that
+	range, whether or not they exceed the limit, so a chart's bins do not
+	depend on the selection. Then each step halves the widest dimension:
+	numeric columns are binned (values become bin starts), others keep their
+	largest values and lump the rest into 'Other'.
+	"""
+	limits = dict(max_values or {})
+	for col, n in limits.items():
+		if col in VALUE_RANGES and pd.api.types.is_numeric_dtype(rolled[col].dtype):
+			rolled = regroup(rolled.assign(**{col: _bin(rolled[col], n)}), dims)
+	while True:
+		over = [col for col, n in limits.items() if rolled[col].nunique() > n]
+		if not over and len(rolled) <= max_rows:
+			return rolled
+		col = over[0] if over else max(dims, key=lambda c: rolled[c].nunique())
+		distinct = rolled[col].nunique()
+		target = limits.get(col, distinct) if over else distinct // 2
+		if distinct <= 1 or target < 1:
+			return rolled
+		coarser = _coarsen(rolled, col, target)
+		if coarser.nunique() >= distinct:
+			return rolled
+		rolled = regroup(rolled.assign(**{col: coarser}), dims)
+
+def _coarsen(rolled: pd.DataFrame, col: str, target: int) -> pd.Series:
+	"""`col` mapped onto at most `target` distinct values."""
+	values = rolled[col]
+	if pd.api.types.is_numeric_dtype(values.dtype):
+		return _bin(values, target)
+	totals = rolled.groupby(col, observed=True)[COUNT].sum()
+	keep = totals.drop(OTHER, errors='ignore').nlargest(max(target - 1, 1)).index
+	if isinstance(values.dtype, pd.CategoricalDtype) and OTHER not in values.cat.categories:
+		values = values.cat.add_categories(OTHER)
+	return values.where(values.isin(keep), OTHER)
+
+def _bin(values: pd.Series, target: int) -> pd.Series:
+	"""Bin starts of at most `target` equal-width bins over the column's
+	range in VALUE_RANGES, or over the values present when it has none."""
+	low, high = VALUE_RANGES.get(values.name) or (values.min(), values.max())
+	width = max(1, int(np.ceil((high - low + 1) / target)))
+	return (low + (values - low) // width * width).astype(values.dtype)
+
+def _mean_std(rolled: pd.DataFrame, dims: list) -> pd.DataFrame:
+	n = rolled['n'].astype('float64')
+	mean = rolled['sum'] / n.where(n > 0)
+	var = (rolled['sumsq'] - rolled['sum'] * mean) / (n - 1).where(n > 1)
+	out = rolled[dims].copy()
+	out['mean'] = mean
+	out['std'] = np.sqrt(var.clip(lower=0))
+	out['lower_bound'] = (out['mean'] - out['std']).clip(lower=0)
+	out['upper_bound'] = out['mean'] + out['std']
+	return out.reset_index(drop=True)
+
+def _kpis(rolled: pd.DataFrame) -> pd.DataFrame:
+	total = int(rolled[COUNT].sum())
+	n = rolled['n'].sum()
+	critical = rolled.loc[rolled['accident_severity'].isin(CRITICAL_SEVERITY), COUNT].sum()
+	return pd.DataFrame({
+		'total': [total],
+		'avg_casualties': [rolled['sum'].sum() / n if n else np.nan],
+		'critical_rate': [critical / total * 100 if total else 0.0],
+	})
@@ -0,0 +1,28 @@
+import hashlib
+import os
+
+# Resized copies of static images, next to the other on-disk caches.
+ASSET_DIR = os.path.join('data', 'assets')
+
+def resized_image(path: str, width: int, scale: int = 2, asset_dir: str = ASSET_DIR) -> str:
+	"""Path of a JPEG copy of the image at `path`, `width` display pixels wide
+	(`scale` times that in real pixels, for high-DPI screens).
+
+	The copy is written once and reused while the original is unchanged, so
+	the browser downloads a few KB instead of the full photo. Pillow (a
+	Streamlit dependency) is only imported when a copy has to be made.
+	"""
+	stat = os.stat(path)
+	digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:12]
+	target = os.path.join(asset_dir, f'{digest}-{width * scale}w-{stat.st_mtime_ns}.jpg')
+	if os.path.exists(target):
+		return target
+	from PIL import Image
+
+	os.makedirs(asset_dir, exist_ok=True)
+	tmp = target + f'.{os.getpid()}.tmp'
+	with Image.open(path) as image:
+		image.thumbnail((width * scale, image.height))
+		image.convert('RGB').save(tmp, 'JPEG', quality=85, optimize=True)
+	os.replace(tmp, target)
+	return target
@@ -0,0 +1,65 @@
+import pandas as pd
+
+from utils.aggregations import CHARTS, finalize, regroup, rollup
+from utils.schema import CRITICAL_SEVERITY, apply_schema
+
+# Sidebar filter columns; every cuboid is keyed by these plus one chart's dims.
+FILTER_DIMS = ['accident_severity', 'area_accident_occured']
+# Bumped when cuboid contents change, so cubes saved with a store are rebuilt.
+CUBE_FORMAT = 2
+
+def cuboid_key(chart_id: str) -> tuple:
+	dims = CHARTS[chart_id]['dims']
+	return tuple(FILTER_DIMS + [d for d in dims if d not in FILTER_DIMS])
+
+def _cuboid_measures() -> dict:
+	measures = {}
+	for chart_id, spec in CHARTS.items():
+		key = cuboid_key(chart_id)
+		measures[key] = measures.get(key) or spec.get('measure')
+	return measures
+
+def build_cube(data) -> dict:
+	"""Precomputes one count cuboid per distinct chart dimension set.
+
+	`data` is the cleaned frame or an iterable of frames (e.g. store
+	partitions); partial cubes are merged, so the rows never need to be in
+	memory at once. Returns {cuboid key: rollup frame}.
+
+	Rows with a NaN filter dim keep it as a cell of its own, so a selection
+	that leaves a filter dim out still counts them (as a FilteredView does).
+	"""
+	if isinstance(data, pd.DataFrame):
+		return {key: rollup(data, list(key), measure, na_keys=FILTER_DIMS) for key, measure in _cuboid_measures().items()}
+	cube = None
+	for part in data:
+		cube = merge_cubes(cube, build_cube(part))
+	return cube
+
+def merge_cubes(a: dict, b: dict) -> dict:
+	"""Adds two cubes cell by cell (cubes of disjoint row sets sum exactly)."""
+	if a is None:
+		return b
+	merged = {}
+	for key in a:
+		# Partitions may carry different category dictionaries: re-type after concat.
+		both = apply_schema(pd.concat([a[key], b[key]], ignore_index=True))
+		merged[key] = regroup(both, list(key), dropna=False)
+	return merged
+
+def query(cube: dict, chart_id: str, selection: dict) -> pd.DataFrame:
+	"""Serves a chart from the cube: slice the cuboid by the selection and sum
+	out the filter dims. Cost depends on the cuboid size, not on the rows.
+
+	`selection` maps filter columns (a subset of FILTER_DIMS) to allowed values.
+	NaN cells of the selected columns never match; those of the other filter
+	dims are summed in, and dropped only where they are a dim of the chart.
+	"""
+	spec = CHARTS[chart_id]
+	cuboid = cube[cuboid_key(chart_id)]
+	mask = pd.Series(True, index=cuboid.index)
+	for col, values in selection.items():
+		mask &= cuboid[col].isin(values)
+	if spec.get('severe'):
+		mask &= cuboid['accident_severity'].isin(CRITICAL_SEVERITY)
+	return finalize(chart_id, regroup(cuboid[mask], spec['dims']))
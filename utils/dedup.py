@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+# Fingerprint of a missing value; any fixed 64-bit constant works.
+NA_HASH = np.uint64(0x9E3779B97F4A7C15)
+# Odd 64-bit multiplier used to mix column hashes into the row fingerprint.
+MIX = np.uint64(0x100000001B3)
+
+def _column_hashes(s: pd.Series) -> np.ndarray:
+	"""64-bit hash of every value of one column.
+
+	Categoricals hash each dictionary value once and gather by code, so the
+	cost per row is a single lookup in a table of at most a few hundred
+	entries. Values hash the same whatever the dictionary order, which keeps
+	fingerprints comparable across separately read chunks.
+	"""
+	if isinstance(s.dtype, pd.CategoricalDtype):
+		table = pd.util.hash_array(np.asarray(s.cat.categories, dtype=object))
+		table = np.append(table, NA_HASH)
+		return table[s.cat.codes.to_numpy()]
+	return pd.util.hash_pandas_object(s, index=False).to_numpy()
+
+def row_fingerprints(df: pd.DataFrame, columns: list = None) -> np.ndarray:
+	"""One 64-bit fingerprint per row over `columns` (default: all). Rows
+	with equal values (NaN equal to NaN) get equal fingerprints; distinct rows
+	collide with probability ~n^2 / 2^65."""
+	fingerprints = np.zeros(len(df), dtype=np.uint64)
+	with np.errstate(over='ignore'):
+		for col in columns or df.columns:
+			fingerprints *= MIX
+			fingerprints ^= _column_hashes(df[col])
+	return fingerprints
+
+class FingerprintSet:
+	"""Fingerprints seen so far, for duplicate detection across appended
+	batches (ingest chunks, incremental updates).
+
+	Kept as a few sorted runs whose sizes at least double from newest to
+	oldest: a batch becomes a new run and runs of similar size are merged,
+	so adding n fingerprints in total costs O(n log n) instead of copying
+	the whole set on every batch.
+	"""
+
+	def __init__(self):
+		self.runs = []
+
+	def __len__(self) -> int:
+		return sum(len(run) for run in self.runs)
+
+	def _seen(self, fingerprints: np.ndarray) -> np.ndarray:
+		"""Membership of sorted `fingerprints`; sorted needles keep the binary
+		searches cache-friendly (several times faster than random order)."""
+		seen = np.zeros(len(fingerprints), dtype=bool)
+		for run in self.runs:
+			found = np.searchsorted(run, fingerprints).clip(max=len(run) - 1)
+			seen |= run[found] == fingerprints
+		return seen
+
+	def _sorted_repeats(self, fingerprints: np.ndarray) -> tuple:
+		# A stable sort keeps equal fingerprints in row order, so within the
+		# batch every copy after the first equals its sorted predecessor.
+		order = np.argsort(fingerprints, kind='stable')
+		ordered = fingerprints[order]
+		repeated = np.zeros(len(ordered), dtype=bool)
+		repeated[1:] = ordered[1:] == ordered[:-1]
+		repeated |= self._seen(ordered)
+		return order, ordered, repeated
+
+	def duplicated(self, fingerprints: np.ndarray) -> np.ndarray:
+		"""The mask add() would return, without adding the batch."""
+		order, _, repeated = self._sorted_repeats(fingerprints)
+		duplicated = np.empty(len(fingerprints), dtype=bool)
+		duplicated[order] = repeated
+		return duplicated
+
+	def add(self, fingerprints: np.ndarray) -> np.ndarray:
+		"""Adds a batch; returns True for rows already seen, earlier in the
+		batch or in a previous one (first occurrences are not duplicates)."""
+		order, ordered, repeated = self._sorted_repeats(fingerprints)
+		new = ordered[~repeated]
+		if len(new):
+			self.runs.append(new)
+		while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+			newer = self.runs.pop()
+			# Stable sort of two concatenated sorted runs is a linear merge.
+			self.runs[-1] = np.sort(np.concatenate([self.runs[-1], newer]), kind='stable')
+		duplicated = np.empty(len(fingerprints), dtype=bool)
+		duplicated[order] = repeated
+		return duplicated
+
+def drop_duplicates(df: pd.DataFrame, seen: FingerprintSet = None) -> tuple:
+	"""Keeps the first occurrence of every row; `seen` carries fingerprints
+	across chunks. Returns (deduplicated frame, number of rows dropped)."""
+	seen = FingerprintSet() if seen is None else seen
+	duplicated = seen.add(row_fingerprints(df))
+	if not duplicated.any():
+		return df, 0
+	return df[~duplicated].reset_index(drop=True), int(duplicated.sum())
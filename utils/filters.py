@@ -0,0 +1,87 @@
+from functools import cached_property, partial
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregations import aggregate_rows
+from utils.cube import FILTER_DIMS, query
+from utils.schema import CRITICAL_SEVERITY
+
+# Sidebar filters, rendered in this order. Adding an entry here is all a new
+# filter needs: its bitmaps are built automatically and, if the column is not
+# one of the cube's FILTER_DIMS, charts fall back to row-level aggregation.
+SIDEBAR_FILTERS = [
+	{
+		'column': 'accident_severity',
+		'header': '1. Accident Severity',
+		'label': 'Severity Levels to Focus On:',
+		'help': 'Select severity levels to include in charts and KPIs.',
+	},
+	{
+		'column': 'area_accident_occured',
+		'header': '2. Geographical Filter',
+		'label': 'Filter by Accident Area:',
+	},
+]
+
+def build_bitmaps(df: pd.DataFrame, columns: list = None) -> dict:
+	"""Packed bitmap (1 bit per row) for every observed value of each filter column.
+
+	Returns {column: {value: uint8 array}}, values in category order. The
+	arrays are read-only so they can be shared between sessions.
+	"""
+	columns = columns or [f['column'] for f in SIDEBAR_FILTERS]
+	bitmaps = {}
+	for col in columns:
+		values = df[col] if isinstance(df[col].dtype, pd.CategoricalDtype) else df[col].astype('category')
+		codes = values.cat.codes.to_numpy()
+		bitmaps[col] = {}
+		for code, value in enumerate(values.cat.categories):
+			bits = np.packbits(codes == code)
+			if bits.any():
+				bits.flags.writeable = False
+				bitmaps[col][value] = bits
+	return bitmaps
+
+def select(bitmaps: dict, selection: dict, n_rows: int) -> np.ndarray:
+	"""Row indices matching the selection: OR of the chosen values' bitmaps
+	within a column, AND across columns. No DataFrame is copied."""
+	mask = np.full((n_rows + 7) // 8, 0xFF, dtype=np.uint8)
+	for col, values in selection.items():
+		column_bits = np.zeros_like(mask)
+		for value in values:
+			if value in bitmaps[col]:
+				np.bitwise_or(column_bits, bitmaps[col][value], out=column_bits)
+		np.bitwise_and(mask, column_bits, out=mask)
+	return np.flatnonzero(np.unpackbits(mask, count=n_rows))
+
+class FilteredView:
+	"""A filter result as row positions over the shared base frame.
+
+	Nothing is copied: charts gather only the columns they group by, and the
+	Serious/Fatal subset is resolved once per view instead of once per chart.
+	`view.counts` has the same counts(chart_id) signature as a cube query.
+	"""
+
+	def __init__(self, df: pd.DataFrame, rows: np.ndarray):
+		self.df = df
+		self.rows = rows
+
+	def __len__(self) -> int:
+		return len(self.rows)
+
+	@cached_property
+	def severe_rows(self) -> np.ndarray:
+		severity = self.df['accident_severity'].take(self.rows)
+		return self.rows[severity.isin(CRITICAL_SEVERITY).to_numpy()]
+
+	def counts(self, chart_id: str) -> pd.DataFrame:
+		return aggregate_rows(self.df, chart_id, self.rows, severe_rows=self.severe_rows)
+
+def selection_counts(selection: dict, cube: dict, df: pd.DataFrame, bitmaps: dict):
+	"""counts(chart_id) for a sidebar selection: slices of the cube when every
+	filtered column is one of its FILTER_DIMS, otherwise a FilteredView over
+	the selected rows."""
+	if set(selection) <= set(FILTER_DIMS):
+		return partial(query, cube, selection=selection)
+	return FilteredView(df, select(bitmaps, selection, len(df))).counts
@@ -0,0 +1,106 @@
+import json
+import os
+
+import pandas as pd
+
+def _text(kind: str):
+	def add(self, body, **kwargs):
+		self._add(kind, body=str(body))
+	return add
+
+class HeadlessUI:
+	"""Stand-in for the streamlit module that records what a section draws.
+
+	Pass it as `ui` to any section's show(): text, metrics and tables become
+	entries of `elements`, charts are stored as Vega-Lite specs, and every
+	frame returned by a counts() wrapped with record() is kept in
+	`aggregates`. Columns and containers are the recorder itself, so layout
+	is flattened into page order.
+	"""
+
+	def __init__(self):
+		self.elements = []
+		self.aggregates = {}
+
+	def record(self, counts):
+		"""Wraps a counts(chart_id) callable so its results land in `aggregates`."""
+		def recorded_counts(chart_id: str):
+			self.aggregates[chart_id] = counts(chart_id)
+			return self.aggregates[chart_id]
+		return recorded_counts
+
+	def _add(self, kind: str, **element) -> None:
+		self.elements.append({'type': kind, **element})
+
+	title = _text('title')
+	header = _text('header')
+	subheader = _text('subheader')
+	caption = _text('caption')
+	markdown = _text('markdown')
+	write = _text('markdown')
+	info = _text('info')
+	success = _text('success')
+	warning = _text('warning')
+	error = _text('error')
+
+	def metric(self, label, value, delta=None, **kwargs):
+		self._add('metric', label=label, value=value, delta=delta)
+
+	def table(self, data, **kwargs):
+		self._add('table', data=pd.DataFrame(data))
+
+	dataframe = table
+
+	def altair_chart(self, chart, **kwargs):
+		spec = chart.to_dict()
+		self._add('chart', id=spec.get('name'), title=chart.title, spec=spec)
+
+	def vega_lite_chart(self, data=None, spec=None, **kwargs):
+		# Templated specs carry their template id as the Vega-Lite name (utils.viz).
+		self._add('chart', id=spec.get('name'), title=spec.get('title'), spec=spec)
+
+	def bar_chart(self, data, **kwargs):
+		self._add('bar_chart', data=pd.DataFrame(data))
+
+	# Layout: everything is recorded in page order.
+	def columns(self, spec, **kwargs):
+		return [self] * (spec if isinstance(spec, int) else len(spec))
+
+	def container(self, **kwargs):
+		return self
+
+	def expander(self, label, **kwargs):
+		return self
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		return False
+
+	@property
+	def charts(self) -> list:
+		return [e for e in self.elements if e['type'] == 'chart']
+
+	def to_dict(self) -> dict:
+		"""JSON-ready page: tables become lists of records."""
+		def plain(element):
+			if 'data' in element:
+				return {**element, 'data': json.loads(element['data'].to_json(orient='records'))}
+			return element
+		return {'elements': [plain(e) for e in self.elements]}
+
+	def write_to(self, out_dir: str) -> None:
+		"""Writes page.json, one Vega-Lite spec per chart (charts/<template
+		id>.vl.json, so file names do not depend on the language) and one CSV
+		per aggregate (aggregates/<chart id>.csv)."""
+		os.makedirs(os.path.join(out_dir, 'charts'), exist_ok=True)
+		os.makedirs(os.path.join(out_dir, 'aggregates'), exist_ok=True)
+		with open(os.path.join(out_dir, 'page.json'), 'w', encoding='utf-8') as f:
+			json.dump(self.to_dict(), f, ensure_ascii=False, default=str)
+		for i, chart in enumerate(self.charts):
+			name = chart['id'] or f'chart_{i:02d}'
+			with open(os.path.join(out_dir, 'charts', f'{name}.vl.json'), 'w', encoding='utf-8') as f:
+				json.dump(chart['spec'], f, ensure_ascii=False)
+		for chart_id, frame in self.aggregates.items():
+			frame.to_csv(os.path.join(out_dir, 'aggregates', f'{chart_id}.csv'), index=False)
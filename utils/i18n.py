@@ -0,0 +1,135 @@
+import json
+import os
+from functools import lru_cache
+
+# Interface languages; English is the source language of every string.
+LANGUAGES = {'en': 'English', 'zh': '中文'}
+DEFAULT_LANGUAGE = os.environ.get('RTA_LANG', 'en')
+LOCALE_DIR = os.path.join(os.path.dirname(__file__), 'locales')
+
+@lru_cache(maxsize=None)
+def catalog(lang: str) -> dict:
+	"""Translations for `lang` from utils/locales/<lang>.json:
+	{'messages': {english: text}, 'categories': {column: {value: label}}}.
+	English (or an unknown language) has an empty catalog."""
+	try:
+		with open(os.path.join(LOCALE_DIR, f'{lang}.json'), encoding='utf-8') as f:
+			entries = json.load(f)
+	except FileNotFoundError:
+		entries = {}
+	messages = {key.strip(): text for key, text in entries.get('messages', {}).items()}
+	categories = entries.get('categories', {})
+	# Category labels by value alone, for sort orders and colour domains in chart specs.
+	values = {value: label for labels in categories.values() for value, label in labels.items()}
+	return {'messages': messages, 'categories': categories, 'values': values}
+
+def language(ui) -> str:
+	"""Language a ui renders in: LocalizedUI carries one, anything else is English."""
+	return getattr(ui, 'lang', 'en')
+
+def translate(message: str, lang: str) -> str:
+	"""Translated `message`, or the message itself when it has no translation.
+	Surrounding whitespace is ignored for the lookup (multi-line markdown)."""
+	if lang == 'en' or not isinstance(message, str):
+		return message
+	return catalog(lang)['messages'].get(message.strip(), message)
+
+def text(ui, message: str, **fields) -> str:
+	"""Translates `message` for `ui`, then fills `fields` in with str.format
+	(translate the template, not the formatted string)."""
+	return translate(message, language(ui)).format(**fields)
+
+def category_label(column: str, value, lang: str):
+	"""Display label of one category value."""
+	if lang == 'en':
+		return value
+	return catalog(lang)['categories'].get(column, {}).get(value, value)
+
+def relabel(data: 'pd.DataFrame', lang: str) -> 'pd.DataFrame':
+	"""Copy of an aggregated frame with category values translated.
+
+	Only chart-sized aggregates are relabelled, at render time; the cleaned
+	dataset, the cube and the aggregation cache stay in English and are
+	shared by every language.
+	"""
+	categories = catalog(lang)['categories'] if lang != 'en' else {}
+	columns = [col for col in data.columns if col in categories]
+	if not columns:
+		return data
+	data = data.copy()
+	for col in columns:
+		labels = categories[col]
+		if data[col].dtype == 'category':
+			data[col] = data[col].cat.rename_categories(lambda value: labels.get(value, value))
+		else:
+			data[col] = data[col].map(lambda value: labels.get(value, value))
+	return data
+
+def localize_spec(spec, lang: str):
+	"""Copy of a Vega-Lite spec with titles translated and category values in
+	sort orders and scale domains relabelled. Field names are untouched."""
+	if lang == 'en':
+		return spec
+	values = catalog(lang)['values']
+	def walk(node, key=None):
+		if isinstance(node, dict):
+			return {k: walk(v, k) for k, v in node.items()}
+		if isinstance(node, list):
+			if key in ('sort', 'domain'):
+				return [values.get(v, v) if isinstance(v, str) else v for v in node]
+			return [walk(v, key) for v in node]
+		if key == 'title':
+			return translate(node, lang)
+		return node
+	return walk(spec)
+
+class LocalizedUI:
+	"""Wraps the streamlit module (or a HeadlessUI) so sections render in `lang`.
+
+	Text elements, metric labels and widget labels are translated on the
+	way through; everything else is passed to the wrapped ui unchanged.
+	Sections keep writing English and draw_template reads `lang` to
+	relabel chart data.
+	"""
+
+	_TEXT = {'title', 'header', 'subheader', 'caption', 'markdown', 'write', 'info', 'success', 'warning', 'error'}
+	_WRAPPED = {'columns', 'container', 'expander'}
+
+	def __init__(self, ui, lang: str):
+		self.ui = ui
+		self.lang = lang
+
+	def __getattr__(self, name):
+		target = getattr(self.ui, name)
+		if name in self._TEXT:
+			def localized_text(body, *args, **kwargs):
+				return target(translate(body, self.lang), *args, **kwargs)
+			return localized_text
+		if name in self._WRAPPED:
+			def localized_layout(*args, **kwargs):
+				if name == 'expander' and args:
+					args = (translate(args[0], self.lang),) + args[1:]
+				result = target(*args, **kwargs)
+				if isinstance(result, (list, tuple)):
+					return [LocalizedUI(item, self.lang) for item in result]
+				return LocalizedUI(result, self.lang)
+			return localized_layout
+		return target
+
+	def metric(self, label, value, *args, **kwargs):
+		return self.ui.metric(translate(label, self.lang), value, *args, **kwargs)
+
+	def multiselect(self, label, options, *args, column: str = None, help: str = None, **kwargs):
+		"""Options keep their (English) values, so selections and cache keys
+		are the same in every language; only their display labels change."""
+		if column is not None:
+			kwargs['format_func'] = lambda value: str(category_label(column, value, self.lang))
+		return self.ui.multiselect(translate(label, self.lang), options, *args,
+			help=translate(help, self.lang), **kwargs)
+
+	def __enter__(self):
+		self.ui.__enter__()
+		return self
+
+	def __exit__(self, *exc):
+		return self.ui.__exit__(*exc)
@@ -1,27 +1,345 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import time
+import tracemalloc
+import warnings
+
 import pandas as pd
-import numpy as np
 import streamlit as st
 
-def load_data(path: str) -> pd.DataFrame:
-	"""Loads the raw dataset, cleans column names, and sets data types."""
-	df = pd.read_csv(path)
-	df.columns = df.columns.str.replace('[^A-Za-z0-9_]+', '', regex=True).str.lower()
-	df = df.replace(['Unknown', 'unknown', 'na', '-1', 'Other'], np.nan)
-	df['time'] = pd.to_datetime(df['time'], format='%H:%M:%S', errors='coerce').dt.time
-	df['day_of_week'] = pd.Categorical(
-		df['day_of_week'], 
-		categories=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], 
-		ordered=True
-	)
-	df['accident_severity'] = pd.Categorical(
-		df['accident_severity'], 
-		categories=['Slight Injury', 'Serious Injury', 'Fatal Injury'], 
-		ordered=True
-	)
-	df['hour'] = df['time'].apply(lambda x: x.hour if pd.notna(x) else np.nan)
-	df['casualty_count'] = pd.to_numeric(df['number_of_casualties'], errors='coerce')
-	AGE_BANDS = ['Under 18', '18-30', '31-50', 'Over 51']
-	df['age_band_of_driver'] = pd.Categorical(df['age_band_of_driver'], categories=AGE_BANDS, ordered=True)
-	EDU_LEVELS = ['Illiterate', 'Elementary school', 'Junior high school', 'High school graduate', 'Above high school', 'College & above']
-	df['educational_level'] = pd.Categorical(df['educational_level'], categories=EDU_LEVELS, ordered=True)
+from utils import dedup
+from utils.cube import CUBE_FORMAT, build_cube, merge_cubes
+from utils.prep import clean_and_engineer_features, raw_dtypes
+from utils.quality import PROFILE_FORMAT, QualityProfile
+from utils.schema import apply_schema
+
+# Columnar cache of the cleaned dataset (see README "Notes").
+CACHE_DIR = 'data'
+CACHE_FILE = 'processed.parquet'
+MANIFEST_FILE = 'processed.json'
+# Bump whenever the cleaning rules change so stale caches are rebuilt.
+CACHE_VERSION = 4
+# Partitioned store written by the chunked ingest (one Parquet file per chunk).
+STORE_DIR = os.path.join(CACHE_DIR, 'store')
+STORE_MANIFEST = '_manifest.json'
+# Cube and quality profile of the stored rows, kept up to date by appends.
+STORE_DERIVED = '_derived.pkl'
+CHUNK_ROWS = 250_000
+
+def load_data(path: str, cache_dir: str = CACHE_DIR, drop_duplicates: bool = False) -> pd.DataFrame:
+	"""Loads the cleaned dataset, reusing the Parquet cache while the source CSV is unchanged.
+
+	`path` may also be a store directory written by ingest_csv_chunked.
+	With `drop_duplicates` only the first copy of each row is kept (by row
+	fingerprint, see utils.dedup); the cache always holds every row.
+	"""
+	if os.path.isdir(path):
+		df = load_store(path)
+	else:
+		source = _source_stat(path)
+		df = _read_cache(path, source, cache_dir)
+		if df is None:
+			df = clean_and_engineer_features(read_raw_csv(path))
+			_write_cache(df, path, source, cache_dir)
+	if drop_duplicates:
+		df, _ = dedup.drop_duplicates(df)
 	return df
+
+def dataset_version(path: str) -> str:
+	"""Cheap identifier of the source data (size and mtime), used in cache keys."""
+	target = os.path.join(path, STORE_MANIFEST) if os.path.isdir(path) else path
+	source = _source_stat(target)
+	return f"{source['size']}-{source['mtime_ns']}"
+
+def read_raw_csv(path: str, **kwargs) -> pd.DataFrame:
+	"""Reads the raw CSV with every text column dictionary-encoded as a categorical."""
+	header = pd.read_csv(path, nrows=0).columns
+	return pd.read_csv(path, dtype=raw_dtypes(header), **kwargs)
+
+def _source_stat(path: str) -> dict:
+	stat = os.stat(path)
+	return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _file_hash(path: str) -> str:
+	digest = hashlib.sha256()
+	with open(path, 'rb') as f:
+		for block in iter(lambda: f.read(1 << 20), b''):
+			digest.update(block)
+	return digest.hexdigest()
+
+def _read_manifest(cache_dir: str, name: str = MANIFEST_FILE):
+	try:
+		with open(os.path.join(cache_dir, name), encoding='utf-8') as f:
+			return json.load(f)
+	except (OSError, ValueError):
+		return None
+
+def _write_manifest(manifest: dict, cache_dir: str, name: str = MANIFEST_FILE) -> None:
+	tmp = os.path.join(cache_dir, name + '.tmp')
+	with open(tmp, 'w', encoding='utf-8') as f:
+		json.dump(manifest, f, indent=2)
+	os.replace(tmp, os.path.join(cache_dir, name))
+
+def _read_cache(path: str, source: dict, cache_dir: str):
+	"""Returns the cached frame, or None when the cache is missing or stale."""
+	manifest = _read_manifest(cache_dir)
+	cache_path = os.path.join(cache_dir, CACHE_FILE)
+	if (
+		manifest is None
+		or manifest.get('version') != CACHE_VERSION
+		or manifest.get('source') != os.path.abspath(path)
+		or manifest.get('size') != source['size']
+		or not os.path.exists(cache_path)
+	):
+		return None
+	if manifest.get('mtime_ns') != source['mtime_ns']:
+		# Same size but touched: only the content hash can tell if it really changed.
+		if manifest.get('sha256') != _file_hash(path):
+			return None
+		manifest['mtime_ns'] = source['mtime_ns']
+		try:
+			_write_manifest(manifest, cache_dir)
+		except OSError:
+			pass
+	try:
+		return pd.read_parquet(cache_path, memory_map=True)
+	except Exception as exc:  # missing pyarrow, truncated file, ...
+		warnings.warn(f"Ignoring unreadable data cache {cache_path}: {exc}")
+		return None
+
+def _write_cache(df: pd.DataFrame, path: str, source: dict, cache_dir: str) -> None:
+	"""Persists the cleaned frame; failures only cost the next cold start."""
+	cache_path = os.path.join(cache_dir, CACHE_FILE)
+	try:
+		os.makedirs(cache_dir, exist_ok=True)
+		df.to_parquet(cache_path + '.tmp', index=False)
+		os.replace(cache_path + '.tmp', cache_path)
+		_write_manifest({
+			'version': CACHE_VERSION,
+			'source': os.path.abspath(path),
+			'size': source['size'],
+			'mtime_ns': source['mtime_ns'],
+			'sha256': _file_hash(path),
+		}, cache_dir)
+	except Exception as exc:
+		warnings.warn(f"Could not write data cache {cache_path}: {exc}")
+
+def ingest_csv_chunked(path: str, store_dir: str = STORE_DIR, chunksize: int = CHUNK_ROWS,
+		drop_duplicates: bool = False, trace_memory: bool = False) -> dict:
+	"""Streams a CSV of any size into a partitioned Parquet store.
+
+	Each chunk goes through clean_and_engineer_features and is written as its
+	own part file, so peak memory depends on `chunksize`, not on the file size,
+	plus the duplicate tracking of the quality profile: up to 16 bytes per
+	distinct row (its fingerprint, and again if it repeats), nothing per
+	further copy. Rows
+	repeating an earlier row, in any chunk, are counted and, with
+	`drop_duplicates`, left out of the store. The count cube and quality
+	profile of the stored rows are built along the way and saved with the
+	store, so append_batch() can update them later.
+	The new store replaces `store_dir` only once every chunk has been written.
+	Returns the store manifest, including the process's peak RSS and, with
+	`trace_memory` (tracemalloc, which slows the ingest down a lot), the
+	peak of Python allocations.
+	"""
+	source = _source_stat(path)
+	tmp_dir = store_dir.rstrip('/\\') + '.tmp'
+	shutil.rmtree(tmp_dir, ignore_errors=True)
+	os.makedirs(tmp_dir)
+	header = pd.read_csv(path, nrows=0).columns
+	started = time.perf_counter()
+	if trace_memory:
+		tracemalloc.start()
+	peak_traced = None
+	rows = parts = duplicates = 0
+	derived = {'parts': 0, 'rows': 0, 'cube': None, 'quality': None, 'cube_format': CUBE_FORMAT, 'quality_format': PROFILE_FORMAT}
+	try:
+		for chunk in pd.read_csv(path, dtype=raw_dtypes(header), chunksize=chunksize):
+			df = clean_and_engineer_features(chunk)
+			written, found = _add_part(df, derived, os.path.join(tmp_dir, _part_name(parts)), drop_duplicates)
+			rows += written
+			duplicates += found
+			parts += 1
+			del chunk, df
+		if trace_memory:
+			peak_traced = tracemalloc.get_traced_memory()[1]
+	finally:
+		if trace_memory:
+			tracemalloc.stop()
+	manifest = {
+		'version': CACHE_VERSION,
+		'source': os.path.abspath(path),
+		'size': source['size'],
+		'mtime_ns': source['mtime_ns'],
+		'rows': rows,
+		'parts': parts,
+		'duplicate_rows': duplicates,
+		'duplicates_dropped': drop_duplicates,
+		'chunksize': chunksize,
+		'seconds': round(time.perf_counter() - started, 3),
+		# Python/numpy allocations while ingesting (None unless traced), and
+		# the process high-water mark.
+		'peak_traced_bytes': peak_traced,
+		'peak_rss_bytes': _peak_rss_bytes(),
+	}
+	_write_derived(derived, tmp_dir)
+	_write_manifest(manifest, tmp_dir, STORE_MANIFEST)
+	if os.path.isdir(store_dir):
+		shutil.rmtree(store_dir)
+	os.replace(tmp_dir, store_dir)
+	return manifest
+
+def append_batch(path: str, store_dir: str = STORE_DIR, drop_duplicates: bool = False) -> dict:
+	"""Appends a raw CSV batch of new accident records to an existing store.
+
+	Only the batch is read and cleaned (same rules as the full ingest); it
+	becomes the next part file. The stored cube and quality profile are
+	updated with the batch alone: cube cells are added (merge_cubes),
+	missing counts and the row-missingness histogram are incremented and the
+	batch's rows are checked against the fingerprints of every stored row.
+	With `drop_duplicates` rows already in the store are not appended.
+	Returns the updated manifest; its `appends` list records every batch.
+	"""
+	manifest = _read_manifest(store_dir, STORE_MANIFEST)
+	if manifest is None or manifest.get('version') != CACHE_VERSION:
+		raise ValueError(f"{store_dir} is not a store written by this version; run the ingest first")
+	started = time.perf_counter()
+	# Stores written before derived state was kept need one full pass.
+	derived = load_derived(store_dir) or _derive(store_dir)
+	df = clean_and_engineer_features(read_raw_csv(path))
+	name = _part_name(manifest['parts'])
+	# Underscore-prefixed files are ignored by Parquet dataset readers.
+	tmp = os.path.join(store_dir, f'_{name}.tmp')
+	written, found = _add_part(df, derived, tmp, drop_duplicates)
+	os.replace(tmp, os.path.join(store_dir, name))
+	_write_derived(derived, store_dir)
+	manifest['rows'] += written
+	manifest['parts'] += 1
+	manifest['duplicate_rows'] = manifest.get('duplicate_rows', 0) + found
+	manifest.setdefault('appends', []).append({
+		'source': os.path.abspath(path),
+		'rows': written,
+		'duplicate_rows': found,
+		'duplicates_dropped': drop_duplicates,
+		'seconds': round(time.perf_counter() - started, 3),
+	})
+	# The manifest is written last: dataset_version() of the store changes
+	# only once the part and the derived state are in place.
+	_write_manifest(manifest, store_dir, STORE_MANIFEST)
+	return manifest
+
+def _part_name(index: int) -> str:
+	return f'part-{index:05d}.parquet'
+
+def _add_part(df: pd.DataFrame, derived: dict, part_path: str, drop_duplicates: bool) -> tuple:
+	"""Writes one cleaned batch as a part file and folds it into `derived`.
+	Returns (rows written, rows repeating a row stored before or earlier in
+	the batch)."""
+	fingerprints = dedup.row_fingerprints(df)
+	if derived['quality'] is None:
+		derived['quality'] = QualityProfile(df.columns)
+	profile = derived['quality']
+	before = profile.duplicate_count
+	found = 0
+	if drop_duplicates:
+		duplicated = profile.fingerprints.duplicated(fingerprints)
+		found = int(duplicated.sum())
+		if found:
+			df, fingerprints = df[~duplicated], fingerprints[~duplicated]
+	profile.update(df, fingerprints)
+	found += profile.duplicate_count - before
+	derived['cube'] = merge_cubes(derived['cube'], build_cube(df))
+	derived['parts'] += 1
+	derived['rows'] += len(df)
+	df.to_parquet(part_path, index=False)
+	return len(df), found
+
+def _derive(store_dir: str) -> dict:
+	"""Cube and quality profile of a store, from a full pass over its parts."""
+	derived = {'parts': 0, 'rows': 0, 'cube': None, 'quality': None, 'cube_format': CUBE_FORMAT, 'quality_format': PROFILE_FORMAT}
+	for df in iter_store(store_dir):
+		if derived['quality'] is None:
+			derived['quality'] = QualityProfile(df.columns)
+		derived['quality'].update(df)
+		derived['cube'] = merge_cubes(derived['cube'], build_cube(df))
+		derived['parts'] += 1
+		derived['rows'] += len(df)
+	return derived
+
+def _write_derived(derived: dict, store_dir: str) -> None:
+	tmp = os.path.join(store_dir, STORE_DERIVED + '.tmp')
+	with open(tmp, 'wb') as f:
+		pickle.dump(derived, f, protocol=pickle.HIGHEST_PROTOCOL)
+	os.replace(tmp, os.path.join(store_dir, STORE_DERIVED))
+
+def load_derived(store_dir: str):
+	"""{'cube', 'quality', 'parts', 'rows'} saved with the store, or None
+	when missing or not matching the manifest (then rebuild from the parts)."""
+	manifest = _read_manifest(store_dir, STORE_MANIFEST)
+	try:
+		with open(os.path.join(store_dir, STORE_DERIVED), 'rb') as f:
+			derived = pickle.load(f)
+	except (OSError, pickle.UnpicklingError, EOFError):
+		return None
+	if manifest is None or (derived['parts'], derived['rows']) != (manifest.get('parts'), manifest.get('rows')):
+		return None
+	if derived.get('cube_format') != CUBE_FORMAT or derived.get('quality_format') != PROFILE_FORMAT:
+		return None
+	return derived
+
+def iter_store(store_dir: str = STORE_DIR, columns: list = None):
+	"""Yields the store one partition at a time (for out-of-core aggregation)."""
+	for name in sorted(os.listdir(store_dir)):
+		if name.endswith('.parquet'):
+			yield apply_schema(pd.read_parquet(os.path.join(store_dir, name), columns=columns))
+
+def load_store(store_dir: str = STORE_DIR, columns: list = None) -> pd.DataFrame:
+	"""Reads the whole partitioned store into one frame (category dictionaries are unified)."""
+	manifest = _read_manifest(store_dir, STORE_MANIFEST)
+	if manifest is None or manifest.get('version') != CACHE_VERSION:
+		raise ValueError(f"{store_dir} is not a store written by this version; re-run the ingest")
+	return apply_schema(pd.read_parquet(store_dir, columns=columns))
+
+def _peak_rss_bytes():
+	"""High-water mark of the process's resident memory, or None where the
+	`resource` module does not exist (Windows)."""
+	try:
+		import resource
+	except ImportError:
+		return None
+	# ru_maxrss is in KiB on Linux, bytes on macOS.
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return peak if sys.platform == 'darwin' else peak * 1024
+
+def _megabytes(n) -> str:
+	return 'n/a' if n is None else f'{n / 1e6:.1f} MB'
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Stream a raw RTA CSV into the partitioned Parquet store.')
+	parser.add_argument('path', help='raw CSV file')
+	parser.add_argument('--append', action='store_true', help='append `path` as a new batch to the existing store')
+	parser.add_argument('--store', default=STORE_DIR, help=f'store directory (default: {STORE_DIR})')
+	parser.add_argument('--chunksize', type=int, default=CHUNK_ROWS, help='rows per chunk / part file')
+	parser.add_argument('--drop-duplicates', action='store_true', help='keep only the first copy of repeated rows')
+	parser.add_argument('--trace-memory', action='store_true', help='also measure peak Python allocations (slow)')
+	args = parser.parse_args()
+	if args.append:
+		stats = append_batch(args.path, args.store, args.drop_duplicates)
+		batch = stats['appends'][-1]
+		print(
+			f"appended {batch['rows']:,} rows in {batch['seconds']}s "
+			f"({batch['duplicate_rows']:,} duplicate rows{' dropped' if args.drop_duplicates else ''}); "
+			f"store now {stats['rows']:,} rows in {stats['parts']} parts"
+		)
+		raise SystemExit
+	stats = ingest_csv_chunked(args.path, args.store, args.chunksize, args.drop_duplicates, args.trace_memory)
+	print(
+		f"{stats['rows']:,} rows in {stats['parts']} parts, {stats['seconds']}s; "
+		f"{stats['duplicate_rows']:,} duplicate rows{' dropped' if args.drop_duplicates else ''}; "
+		f"peak traced {_megabytes(stats['peak_traced_bytes'])}, peak RSS {_megabytes(stats['peak_rss_bytes'])}"
+	)
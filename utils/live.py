@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+
+import pandas as pd
+
+from utils import shared
+from utils.cube import build_cube
+from utils.filters import build_bitmaps
+from utils.io import dataset_version, load_data, load_derived
+from utils.quality import QualityProfile
+from utils.sampling import StratifiedSample
+
+# Seconds between checks of the data source for a new version (a stat of
+# the CSV or the store manifest); 0 turns the background watcher off.
+WATCH_INTERVAL = float(os.environ.get('RTA_WATCH_INTERVAL', 10))
+
+class Snapshot:
+	"""One loaded version of the dataset and everything derived from it.
+
+	Nothing in a snapshot is modified after it is built: the frame is
+	read-only (utils.shared.freeze) and a newer version gets a new snapshot,
+	so a rerun can keep using the one it started with. `quality` is the
+	finished data-quality report (QualityProfile.report), not the profile,
+	so the row fingerprints are not kept. Samples for progressive rendering
+	are drawn on first use.
+	"""
+
+	def __init__(self, version: str, data: pd.DataFrame, bitmaps: dict, cube: dict, quality: dict, seconds: float):
+		self.version = version
+		self.data = data
+		self.bitmaps = bitmaps
+		self.cube = cube
+		self.quality = quality
+		self.seconds = seconds
+		self.loaded_at = time.time()
+		self._samples = {}
+		self._sample_lock = threading.Lock()
+
+	def sample(self, size: int) -> StratifiedSample:
+		"""Stratified sample of the data (utils/sampling.py), drawn once per size."""
+		with self._sample_lock:
+			if size not in self._samples:
+				self._samples[size] = StratifiedSample(self.data, size)
+			return self._samples[size]
+
+def build_snapshot(path: str, version: str) -> Snapshot:
+	"""Loads `version` of `path` with its filter index, count cube and quality
+	report. The frame and the filter bitmaps are mapped from the
+	cross-process store when RTA_SHARED_DIR is set; store directories reuse
+	the cube and profile saved with them (see utils.io.append_batch)."""
+	started = time.perf_counter()
+	if shared.SHARED_DIR:
+		attached = shared.attach(path, version, lambda: load_data(path), index=build_bitmaps)
+		data, bitmaps = attached.frame, attached.bitmaps
+	else:
+		data = shared.freeze(load_data(path))
+		bitmaps = build_bitmaps(data)
+	derived = load_derived(path) if os.path.isdir(path) else None
+	# A batch appended while the parts were being read leaves the saved
+	# state ahead of the frame; derive from the frame then.
+	if derived is None or derived['rows'] != len(data):
+		derived = {'cube': build_cube(data), 'quality': QualityProfile.from_frame(data)}
+	quality = derived['quality'].report(data)
+	return Snapshot(version, data, bitmaps, derived['cube'], quality, time.perf_counter() - started)
+
+class LiveDataset:
+	"""Versioned reference to the current Snapshot of a data source.
+
+	A background thread checks the source every `interval` seconds and, when
+	its version changes, builds the new snapshot off the request path, then
+	swaps the reference in one assignment. Sessions call current() once per
+	rerun: in-flight reruns finish on the version they started with and the
+	next rerun sees the new one, without a restart or a cache clear. A failed
+	reload keeps serving the previous version and is reported in `error`.
+	"""
+
+	def __init__(self, path: str, build=build_snapshot, interval: float = WATCH_INTERVAL):
+		self.path = path
+		self.interval = interval
+		self.swaps = 0
+		self.error = None
+		self._build = build
+		self._snapshot = None
+		self._lock = threading.Lock()
+		self._stop = threading.Event()
+		self._thread = None
+
+	def current(self) -> Snapshot:
+		"""The latest complete snapshot; only the very first call waits for a load."""
+		snapshot = self._snapshot
+		if snapshot is None:
+			with self._lock:
+				if self._snapshot is None:
+					self._snapshot = self._build(self.path, dataset_version(self.path))
+				snapshot = self._snapshot
+			self.start()
+		return snapshot
+
+	def refresh(self) -> bool:
+		"""Builds and swaps in the source's current version if it changed.
+		Returns True when a new snapshot was swapped in."""
+		try:
+			version = dataset_version(self.path)
+		except OSError as e:
+			# The source is being replaced; try again on the next check.
+			self.error = e
+			return False
+		with self._lock:
+			if self._snapshot is not None and version == self._snapshot.version:
+				return False
+			try:
+				snapshot = self._build(self.path, version)
+				# Still being written: wait until the version settles.
+				if dataset_version(self.path) != version:
+					return False
+			except Exception as e:
+				self.error = e
+				return False
+			self._snapshot = snapshot
+			self.swaps += 1
+			self.error = None
+		return True
+
+	def start(self) -> None:
+		if self.interval <= 0 or self._thread is not None:
+			return
+		self._thread = threading.Thread(target=self._watch, name='rta-data-watch', daemon=True)
+		self._thread.start()
+
+	def stop(self) -> None:
+		self._stop.set()
+
+	def _watch(self) -> None:
+		while not self._stop.wait(self.interval):
+			self.refresh()
@@ -0,0 +1,92 @@
+import os
+import threading
+from collections import OrderedDict
+
+from utils.shared import freeze
+
+# Maximum number of aggregated frames kept (each is a few KB at most).
+MAX_ENTRIES = int(os.environ.get('RTA_AGG_CACHE_SIZE', 512))
+
+class AggregationCache:
+	"""Thread-safe LRU cache of aggregated chart frames.
+
+	One instance is shared by every session on the server (see
+	st.cache_resource in app.py), so cached frames must be read-only;
+	memoized() freezes them.
+	"""
+
+	def __init__(self, maxsize: int = MAX_ENTRIES):
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self._entries = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get_or_compute(self, key, compute):
+		with self._lock:
+			if key in self._entries:
+				self._entries.move_to_end(key)
+				self.hits += 1
+				return self._entries[key]
+			self.misses += 1
+		# Computed outside the lock so other sessions are not blocked; two
+		# sessions missing the same key at once simply compute it twice.
+		value = compute()
+		with self._lock:
+			self._entries[key] = value
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+				self.evictions += 1
+		return value
+
+	def peek(self, key):
+		"""The cached value for `key` (counted as a hit), or None without
+		computing anything (a later get_or_compute counts the miss)."""
+		with self._lock:
+			if key not in self._entries:
+				return None
+			self._entries.move_to_end(key)
+			self.hits += 1
+			return self._entries[key]
+
+	def stats(self) -> dict:
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				'hits': self.hits,
+				'misses': self.misses,
+				'hit_rate': self.hits / lookups if lookups else 0.0,
+				'evictions': self.evictions,
+				'entries': len(self._entries),
+				'maxsize': self.maxsize,
+			}
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+
+def selection_key(selection: dict) -> tuple:
+	"""Normalized filter state: the same choice in any order gives the same key."""
+	return tuple(sorted((col, tuple(sorted(map(str, values)))) for col, values in selection.items()))
+
+def frozen_counts(counts):
+	"""Wraps a counts(chart_id) callable so every frame it returns is
+	read-only (utils.shared.freeze): sections get the immutability guarantee
+	whether or not results are shared."""
+	def read_only_counts(chart_id: str):
+		return freeze(counts(chart_id))
+	return read_only_counts
+
+def memoized(cache: AggregationCache, counts, scope: tuple):
+	"""Wraps a counts(chart_id) callable so results are cached under scope + chart id.
+
+	`scope` must identify everything the results depend on besides the chart
+	id, i.e. the dataset version and the normalized selection. Cached frames
+	are shared by every session, so they are frozen before being stored.
+	"""
+	counts = frozen_counts(counts)
+	def cached_counts(chart_id: str):
+		return cache.get_or_compute(scope + (chart_id,), lambda: counts(chart_id))
+	return cached_counts
@@ -0,0 +1,179 @@
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	# Annotations only; pandas is imported lazily (see StartupReport).
+	import pandas as pd
+
+# Per-rerun traces are appended to this JSON lines file when set.
+TRACE_FILE = os.environ.get('RTA_TRACE_FILE')
+# The startup report of the first script run in this process is written
+# here as JSON when set.
+STARTUP_FILE = os.environ.get('RTA_STARTUP_FILE')
+
+# Phases recorded for every chart, in display order:
+#   prep:      computing the aggregated frame (counts(chart_id), pandas work)
+#   spec:      the chart template's Vega-Lite spec and the filled-spec cache
+#              lookup (utils.viz.filled_spec)
+#   serialize: relabelling the frame and turning it into the spec's inline
+#              JSON data, i.e. what is sent to the browser (cache misses only)
+#   render:    the st.* call itself (Streamlit's own marshalling)
+PHASES = ['prep', 'spec', 'serialize', 'render']
+
+class RerunTrace:
+	"""Wall times of one script run, grouped by section, phase and item name."""
+
+	def __init__(self, **meta):
+		self.run_id = uuid.uuid4().hex[:12]
+		self.meta = meta
+		self.started = time.time()
+		self.records = []
+		self.payloads = []
+		self.section = None
+
+	def add(self, phase: str, name: str, seconds: float) -> None:
+		self.records.append({'section': self.section, 'phase': phase, 'name': name, 'seconds': seconds})
+
+	def add_payload(self, name: str, spec: dict) -> None:
+		"""Size of a chart's Vega-Lite JSON with its data inline, and the
+		number of data rows it embeds."""
+		self.payloads.append({
+			'section': self.section,
+			'name': name,
+			'rows': len(spec.get('data', {}).get('values', [])),
+			'bytes': len(json.dumps(spec, separators=(',', ':'), default=str).encode('utf-8')),
+		})
+
+	def frame(self) -> 'pd.DataFrame':
+		# pandas is imported here, not at startup: see StartupReport.
+		import pandas as pd
+		return pd.DataFrame(self.records, columns=['section', 'phase', 'name', 'seconds'])
+
+	def summary(self) -> 'pd.DataFrame':
+		"""Seconds per section (rows) and phase (columns), plus the section total."""
+		records = self.frame()
+		if records.empty:
+			return records.iloc[:0, :0]
+		table = records.pivot_table(index='section', columns='phase', values='seconds', aggfunc='sum', sort=False)
+		return table.reindex(columns=[p for p in PHASES + ['total'] if p in table.columns]).fillna(0.0)
+
+	def to_dict(self) -> dict:
+		return {
+			'run_id': self.run_id,
+			'started': self.started,
+			**self.meta,
+			'records': self.records,
+			'payloads': self.payloads,
+		}
+
+	def dump(self, path: str) -> None:
+		"""Appends the trace as one JSON line."""
+		with open(path, 'a', encoding='utf-8') as f:
+			f.write(json.dumps(self.to_dict(), default=str) + '\n')
+
+# Streamlit runs each session's script in its own thread.
+_local = threading.local()
+
+def start_trace(**meta) -> RerunTrace:
+	"""Starts tracing the current script run; `meta` is stored with the trace."""
+	_local.trace = RerunTrace(**meta)
+	return _local.trace
+
+def stop_trace() -> RerunTrace:
+	trace, _local.trace = current(), None
+	return trace
+
+def current() -> RerunTrace:
+	"""The trace of the running script, or None when tracing is off."""
+	return getattr(_local, 'trace', None)
+
+@contextmanager
+def section(name: str):
+	"""Attributes everything timed inside to `name` and records its total."""
+	trace = current()
+	if trace is None:
+		yield
+		return
+	outer, trace.section = trace.section, name
+	start = time.perf_counter()
+	try:
+		yield
+	finally:
+		trace.add('total', name, time.perf_counter() - start)
+		trace.section = outer
+
+@contextmanager
+def timed(phase: str, name: str):
+	trace = current()
+	if trace is None:
+		yield
+		return
+	start = time.perf_counter()
+	try:
+		yield
+	finally:
+		trace.add(phase, name, time.perf_counter() - start)
+
+def timed_counts(counts):
+	"""Wraps a counts(chart_id) callable so each call is recorded as prep."""
+	def traced_counts(chart_id: str):
+		with timed('prep', chart_id):
+			return counts(chart_id)
+	return traced_counts
+
+# Order of the startup phases recorded by app.py.
+STARTUP_PHASES = ['assets', 'shell', 'import', 'data', 'render']
+
+class StartupReport:
+	"""Wall time of each startup phase of one script run:
+
+	  assets  sidebar images (pre-resized copies, see utils/assets.py)
+	  shell   page config, title, sidebar text and language picker
+	  import  pandas, Altair and the analysis modules
+	  data    loading the dataset snapshot (utils/live.py)
+	  render  filters, sections and charts
+
+	Everything before `import` reaches the browser before any heavy work
+	starts. `cold` marks the first run in the process, the one that pays
+	for imports and the data load.
+	"""
+
+	def __init__(self):
+		self.cold = _first_startup is None
+		self.phases = {}
+		self._mark = time.perf_counter()
+
+	def lap(self, phase: str) -> None:
+		"""Records the time since the previous lap (or the start) as `phase`."""
+		now = time.perf_counter()
+		self.phases[phase] = self.phases.get(phase, 0.0) + now - self._mark
+		self._mark = now
+
+	@property
+	def total(self) -> float:
+		return sum(self.phases.values())
+
+	def to_dict(self) -> dict:
+		return {'cold': self.cold, 'total': self.total, 'phases': self.phases}
+
+	def format(self) -> str:
+		phases = ', '.join(f'{name} {seconds:.3f}s' for name, seconds in self.phases.items())
+		return f"{'cold' if self.cold else 'warm'} start {self.total:.3f}s: {phases}"
+
+_first_startup = None
+
+def finish_startup(report: StartupReport) -> StartupReport:
+	"""Keeps the first report of the process (written to STARTUP_FILE when
+	set) and returns it."""
+	global _first_startup
+	if _first_startup is None:
+		_first_startup = report
+		if STARTUP_FILE:
+			with open(STARTUP_FILE, 'w', encoding='utf-8') as f:
+				json.dump({'pid': os.getpid(), **report.to_dict()}, f, indent=2)
+	return _first_startup
@@ -3,38 +3,87 @@
 import pandas as pd
 import numpy as np
 
-def clean_and_engineer_features(df: pd.DataFrame) -> pd.DataFrame:
+from utils.schema import NUMERIC_COLUMNS, PART_OF_DAY, apply_schema
+
+# 缺失值哨兵：默认对所有文本列生效，可按列覆盖（空列表表示该列不替换）
+SENTINELS = ['Unknown', 'unknown', 'na', '-1', 'Other']
+COLUMN_SENTINELS = {}
+# 基数超过该比例的文本列不转为分类
+MAX_CATEGORY_RATIO = 0.5
+
+def normalize_columns(columns: pd.Index) -> pd.Index:
+	"""统一列名：去掉非字母数字字符并转为小写。"""
+	return columns.str.replace('[^A-Za-z0-9_]+', '', regex=True).str.lower()
+
+def raw_dtypes(columns) -> dict:
+	"""read_csv 的 dtype 参数：除 schema 中的数值列外，所有列直接读为 category。"""
+	normalized = normalize_columns(pd.Index(columns))
+	return {raw: 'category' for raw, name in zip(columns, normalized) if name not in NUMERIC_COLUMNS}
+
+def replace_sentinels(df: pd.DataFrame, sentinels: dict = None) -> pd.DataFrame:
+	"""
+	把哨兵值替换为 NaN。只在分类字典（每列几十个取值）上删除对应类别，
+	而不是逐个单元格比较；尚未编码的低基数文本列会先转为分类。
+	:param sentinels: 按列覆盖 COLUMN_SENTINELS 的哨兵列表
+	"""
+	overrides = {**COLUMN_SENTINELS, **(sentinels or {})}
+	for col in df.columns:
+		values = overrides.get(col, SENTINELS)
+		s = df[col]
+		if not values or pd.api.types.is_numeric_dtype(s) or pd.api.types.is_datetime64_any_dtype(s):
+			continue
+		if not isinstance(s.dtype, pd.CategoricalDtype):
+			if s.nunique() > MAX_CATEGORY_RATIO * max(len(s), 1):
+				df[col] = s.where(~s.isin(values))
+				continue
+			s = s.astype('category')
+		df[col] = s.cat.remove_categories(s.cat.categories.intersection(values))
+	return df
+
+# 时段划分：按小时映射到 PART_OF_DAY 的下标
+PART_OF_DAY_BY_HOUR = np.array([0] * 6 + [1] * 6 + [2] * 6 + [3] * 6, dtype=np.int8)
+
+def add_time_features(df: pd.DataFrame, column: str = 'time') -> pd.DataFrame:
+	"""
+	向量化的时间特征：
+	- time: 当天经过的时间 (timedelta，秒精度，即 seconds-of-day)
+	- hour / minute: Int8 (无法解析时为 <NA>)
+	- part_of_day: 有序分类 Night / Morning / Afternoon / Evening
+	只解析去重后的时间字符串（通常仅上千个），再按编码回填到每一行，不产生逐行 Python 对象。
+	"""
+	codes, uniques = pd.factorize(df[column])
+	parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format='%H:%M:%S', errors='coerce')
+	seconds = (parsed.dt.hour * 3600 + parsed.dt.minute * 60 + parsed.dt.second).to_numpy(dtype='float64', na_value=np.nan)
+	# factorize 把缺失值编码为 -1，对应追加在末尾的 NaN
+	seconds = np.append(seconds, np.nan)[codes]
+	valid = ~np.isnan(seconds)
+	whole = np.where(valid, seconds, 0).astype(np.int32)
+	hour = (whole // 3600).astype(np.int8)
+	df[column] = pd.to_timedelta(np.where(valid, whole, np.nan), unit='s')
+	df['hour'] = pd.arrays.IntegerArray(hour, ~valid)
+	df['minute'] = pd.arrays.IntegerArray((whole // 60 % 60).astype(np.int8), ~valid)
+	df['part_of_day'] = pd.Categorical.from_codes(
+		np.where(valid, PART_OF_DAY_BY_HOUR[hour], -1),
+		categories=PART_OF_DAY,
+		ordered=True
+	)
+	return df
+
+def clean_and_engineer_features(df: pd.DataFrame, sentinels: dict = None) -> pd.DataFrame:
 	"""
 	对原始数据进行清洗和特征工程：
 	- 统一列名
-	- 替换缺失值
+	- 替换缺失值（文本列转为分类，哨兵值在类别字典上删除）
 	- 时间处理
-	- 类型转换
 	- 新特征生成
+	- 按 utils/schema.py 转换为最窄的类型
+	:param sentinels: 按列覆盖的哨兵列表，例如 {'casualty_severity': ['na']}
 	"""
-	df.columns = df.columns.str.replace('[^A-Za-z0-9_]+', '', regex=True).str.lower()
-	df = df.replace(['Unknown', 'unknown', 'na', '-1', 'Other'], np.nan)
+	df.columns = normalize_columns(df.columns)
+	df = replace_sentinels(df, sentinels)
 	if 'time' in df.columns:
-		df['time'] = pd.to_datetime(df['time'], format='%H:%M:%S', errors='coerce').dt.time
-		df['hour'] = df['time'].apply(lambda x: x.hour if pd.notna(x) else np.nan)
-	if 'day_of_week' in df.columns:
-		df['day_of_week'] = pd.Categorical(
-			df['day_of_week'], 
-			categories=['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], 
-			ordered=True
-		)
-	if 'accident_severity' in df.columns:
-		df['accident_severity'] = pd.Categorical(
-			df['accident_severity'], 
-			categories=['Slight Injury', 'Serious Injury', 'Fatal Injury'], 
-			ordered=True
-		)
+		df = add_time_features(df)
 	if 'number_of_casualties' in df.columns:
-		df['casualty_count'] = pd.to_numeric(df['number_of_casualties'], errors='coerce')
-	AGE_BANDS = ['Under 18', '18-30', '31-50', 'Over 51']
-	if 'age_band_of_driver' in df.columns:
-		df['age_band_of_driver'] = pd.Categorical(df['age_band_of_driver'], categories=AGE_BANDS, ordered=True)
-	EDU_LEVELS = ['Illiterate', 'Elementary school', 'Junior high school', 'High school graduate', 'Above high school', 'College & above']
-	if 'educational_level' in df.columns:
-		df['educational_level'] = pd.Categorical(df['educational_level'], categories=EDU_LEVELS, ordered=True)
-	return df
+		df['casualty_count'] = df['number_of_casualties']
+	# 有序分类、小整数等类型统一由 utils/schema.py 决定
+	return apply_schema(df)
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from utils.dedup import FingerprintSet, row_fingerprints
+
+# Bumped when the profile's attributes change, so profiles saved with a
+# store (utils.io) are rebuilt.
+PROFILE_FORMAT = 2
+# Positions of the first duplicate rows kept for the report's preview.
+PREVIEW_LIMIT = 100
+
+class QualityProfile:
+	"""Column profiles behind the data-quality section.
+
+	Holds per-column missing counts, the histogram of missing columns per
+	row and the 64-bit row fingerprints seen so far (utils.dedup), so the
+	report is computed once per dataset version and appended rows only cost
+	their own size (update()). Duplicates are kept as a count, the
+	fingerprints of the rows that repeat and the positions of the first
+	PREVIEW_LIMIT copies, so memory grows with the distinct rows (at most
+	16 bytes each), not with the number of duplicates.
+	"""
+
+	def __init__(self, columns):
+		self.columns = list(columns)
+		self.rows = 0
+		self.missing = pd.Series(0, index=self.columns, dtype='int64')
+		self.row_missing = np.zeros(len(self.columns) + 1, dtype=np.int64)
+		self.fingerprints = FingerprintSet()
+		self.repeated = FingerprintSet()
+		self.duplicate_count = 0
+		self.duplicate_positions = np.empty(0, dtype=np.int64)
+
+	@classmethod
+	def from_frame(cls, df: pd.DataFrame) -> 'QualityProfile':
+		profile = cls(df.columns)
+		profile.update(df)
+		return profile
+
+	def update(self, df: pd.DataFrame, fingerprints: np.ndarray = None) -> 'QualityProfile':
+		"""Adds `df` as rows appended after the ones already profiled.
+		`fingerprints` may pass row_fingerprints(df) when already computed."""
+		if list(df.columns) != self.columns:
+			raise ValueError(f"Expected columns {self.columns}, got {list(df.columns)}")
+		missing_per_row = np.zeros(len(df), dtype=np.int64)
+		for col in self.columns:
+			isna = df[col].isna().to_numpy()
+			self.missing[col] += int(isna.sum())
+			missing_per_row += isna
+		self.row_missing += np.bincount(missing_per_row, minlength=len(self.row_missing))
+
+		fingerprints = row_fingerprints(df) if fingerprints is None else fingerprints
+		duplicated = self.fingerprints.add(fingerprints)
+		self.repeated.add(fingerprints[duplicated])
+		self.duplicate_count += int(duplicated.sum())
+		if len(self.duplicate_positions) < PREVIEW_LIMIT:
+			positions = np.flatnonzero(duplicated)[:PREVIEW_LIMIT - len(self.duplicate_positions)] + self.rows
+			self.duplicate_positions = np.concatenate([self.duplicate_positions, positions])
+		self.rows += len(df)
+		return self
+
+	@property
+	def duplicate_groups(self) -> int:
+		"""Number of distinct rows that occur more than once."""
+		return len(self.repeated)
+
+	def report(self, df: pd.DataFrame, preview_rows: int = 5) -> dict:
+		"""Everything the data-quality section shows. `df` is the profiled
+		frame, used only to look up the duplicate preview rows (at most
+		PREVIEW_LIMIT)."""
+		missing = self.missing.rename_axis('column').reset_index(name='missing_count')
+		missing['missing_pct'] = (missing['missing_count'] / self.rows * 100).round(2)
+		missing = missing.sort_values('missing_pct', ascending=False)
+
+		observed = np.flatnonzero(self.row_missing)
+		row_missing = pd.DataFrame({'missing_cols_count': observed, 'row_count': self.row_missing[observed]})
+
+		return {
+			'rows': self.rows,
+			'missing': missing,
+			'duplicate_count': self.duplicate_count,
+			'duplicate_groups': self.duplicate_groups,
+			'duplicate_preview': df.iloc[self.duplicate_positions[:preview_rows]],
+			'row_missing': row_missing,
+		}
+
+def quality_report(df: pd.DataFrame, preview_rows: int = 5) -> dict:
+	"""Everything the data-quality section shows: missing values per column,
+	duplicate rows and the distribution of missing columns per row."""
+	return QualityProfile.from_frame(df).report(df, preview_rows)
@@ -0,0 +1,87 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregations import CHARTS, aggregate_rows
+from utils.i18n import text
+
+# Progressive rendering (see utils.scheduler.progressive): rows in the
+# stratified sample the first charts are estimated from, and how long a
+# rerun waits for exact results before drawing the estimate instead.
+SAMPLE_SIZE = int(os.environ.get('RTA_SAMPLE_SIZE', 50_000))
+LATENCY_TARGET = float(os.environ.get('RTA_LATENCY_TARGET', 0.5))
+# Strata of the sample: rare severities are over-sampled, not lost.
+STRATUM = 'accident_severity'
+
+class StratifiedSample:
+	"""Row positions of a random sample of `df`, stratified by `column`.
+
+	Each stratum gets its proportional share of `size` rows, but at least
+	size / (2 * strata) (or all of its rows), so the few Fatal Injury
+	accidents are well represented; the sample can therefore be somewhat
+	larger than `size`. Every sampled row carries the weight
+	N_h / n_h of its stratum, so weighted counts estimate the full counts.
+	"""
+
+	def __init__(self, df: pd.DataFrame, size: int = SAMPLE_SIZE, column: str = STRATUM, seed: int = 0):
+		codes = df[column].cat.codes.to_numpy()
+		totals = np.bincount(codes[codes >= 0])
+		strata = np.flatnonzero(totals)
+		share = totals * (size / max(len(df), 1))
+		floor = size // (2 * max(len(strata), 1))
+		allocation = np.minimum(totals, np.maximum(share.astype(np.int64), floor))
+		rng = np.random.default_rng(seed)
+		rows, weights = [], []
+		for stratum in strata:
+			members = np.flatnonzero(codes == stratum)
+			chosen = rng.choice(members, allocation[stratum], replace=False) if allocation[stratum] < len(members) else members
+			rows.append(chosen)
+			weights.append(np.full(len(chosen), totals[stratum] / len(chosen)))
+		order = np.argsort(np.concatenate(rows), kind='stable')
+		self.rows = np.concatenate(rows)[order]
+		self.weights = np.concatenate(weights)[order]
+		self.total_rows = len(df)
+
+	def __len__(self) -> int:
+		return len(self.rows)
+
+	@property
+	def complete(self) -> bool:
+		"""True when the sample holds every row (estimates would cost as much as exact results)."""
+		return len(self.rows) >= self.total_rows
+
+def _selected(bitmaps: dict, selection: dict, rows: np.ndarray) -> np.ndarray:
+	"""Mask over `rows` of the rows matching `selection`, read from the
+	filter bitmaps (utils.filters.build_bitmaps) at those positions only."""
+	mask = np.ones(len(rows), dtype=bool)
+	byte, bit = rows >> 3, 7 - (rows & 7)
+	for col, values in selection.items():
+		column_mask = np.zeros(len(rows), dtype=bool)
+		for value in values:
+			if value in bitmaps[col]:
+				column_mask |= (bitmaps[col][value][byte] >> bit) & 1 == 1
+		mask &= column_mask
+	return mask
+
+def estimate_counts(sample: StratifiedSample, selection: dict, df: pd.DataFrame, bitmaps: dict):
+	"""counts(chart_id) estimated from the sampled rows matching `selection`,
+	with the same frames as the exact counts. Counts are rounded; every
+	frame is marked with attrs['preliminary'] (see preliminary_badge)."""
+	keep = _selected(bitmaps, selection, sample.rows)
+	rows, weights = sample.rows[keep], sample.weights[keep]
+	def estimated_counts(chart_id: str) -> pd.DataFrame:
+		data = aggregate_rows(df, chart_id, rows, weights=weights)
+		count = 'total' if chart_id == 'kpis' else CHARTS[chart_id].get('name', 'count')
+		if count in data.columns:
+			data[count] = data[count].round().astype('int64')
+		data.attrs['preliminary'] = {'sample_rows': len(rows), 'rows': sample.total_rows}
+		return data
+	return estimated_counts
+
+def preliminary_badge(data: pd.DataFrame, ui) -> None:
+	"""Caption marking `data` as a sample estimate; nothing for exact results."""
+	preliminary = data.attrs.get('preliminary')
+	if preliminary:
+		ui.caption(text(ui, "⏳ Preliminary: estimated from {sample_rows:,} sampled rows (stratified by severity); exact figures follow.",
+			sample_rows=preliminary['sample_rows']))
@@ -0,0 +1,70 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from utils.aggregations import CHARTS
+
+# Worker threads for chart aggregations, shared by every session on the
+# server; 1 (or less) runs them in the script thread as before.
+POOL_SIZE = int(os.environ.get('RTA_AGG_WORKERS', min(4, os.cpu_count() or 1)))
+
+def make_pool(size: int = POOL_SIZE):
+	"""Thread pool for prefetch(), or None when `size` asks for sequential runs."""
+	if size <= 1:
+		return None
+	return ThreadPoolExecutor(max_workers=size, thread_name_prefix='rta-agg')
+
+def prefetch(counts, pool, chart_ids: list = None):
+	"""Starts counts(chart_id) for every chart (default: all of CHARTS, in
+	layout order) on `pool` and returns a counts(chart_id) callable that
+	waits for the matching result. Sections keep calling it in page order,
+	so the layout is unchanged while the aggregations overlap; errors are
+	raised in the section that asks for the chart, as before.
+
+	`counts` runs in worker threads and must not call st.*.
+	"""
+	if pool is None:
+		return counts
+	futures = {chart_id: pool.submit(counts, chart_id) for chart_id in (CHARTS if chart_ids is None else chart_ids)}
+	def scheduled_counts(chart_id: str):
+		future = futures.get(chart_id)
+		return counts(chart_id) if future is None else future.result()
+	return scheduled_counts
+
+def progressive(counts, estimate, pool, latency_target: float, chart_ids: list = None, cached=None):
+	"""Sample-first variant of prefetch(). Every exact counts(chart_id) starts
+	on `pool` at once, as with prefetch(); a chart whose exact result is not
+	ready `latency_target` seconds after this call gets estimate(chart_id)
+	instead. `cached(chart_id)` returns an exact result already in the
+	aggregation cache, or None: those charts are never estimated, with or
+	without a pool (without one, every other chart is estimated).
+
+	Returns (counts, finish). finish() waits for the exact results of the
+	estimated charts and returns True if there were any: with a memoized
+	`counts` they are then in the aggregation cache, and a rerun draws them.
+	"""
+	deadline = time.perf_counter() + latency_target
+	futures = {} if pool is None else {chart_id: pool.submit(counts, chart_id) for chart_id in (CHARTS if chart_ids is None else chart_ids)}
+	estimated = []
+	def progressive_counts(chart_id: str):
+		result = cached(chart_id) if cached is not None else None
+		if result is not None:
+			return result
+		future = futures.get(chart_id)
+		if future is None and pool is not None:
+			return counts(chart_id)
+		if future is not None:
+			wait([future], timeout=max(0.0, deadline - time.perf_counter()))
+			if future.done():
+				return future.result()
+		estimated.append(chart_id)
+		return estimate(chart_id)
+	def finish() -> bool:
+		for chart_id in estimated:
+			future = futures.get(chart_id)
+			if future is None:
+				counts(chart_id)
+			else:
+				future.result()
+		return bool(estimated)
+	return progressive_counts, finish
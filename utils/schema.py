@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+# Shared category orders (also used for chart sorting and colour domains).
+ACCIDENT_SEVERITY_ORDER = ['Slight Injury', 'Serious Injury', 'Fatal Injury']
+CRITICAL_SEVERITY = ['Serious Injury', 'Fatal Injury']
+DAYS_OF_WEEK = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+AGE_BANDS = ['Under 18', '18-30', '31-50', 'Over 51']
+EDU_LEVELS = ['Illiterate', 'Elementary school', 'Junior high school', 'High school graduate', 'Above high school', 'College & above']
+PART_OF_DAY = ['Night', 'Morning', 'Afternoon', 'Evening']
+
+def ordered(categories: list) -> pd.CategoricalDtype:
+	return pd.CategoricalDtype(categories, ordered=True)
+
+# Narrowest dtype for every column of the cleaned RTA dataset. Categoricals get
+# int8 codes (all dictionaries here are < 128 values); values outside an ordered
+# category list become NaN. Columns not listed keep the dtype cleaning gave them.
+SCHEMA = {
+	'time': 'timedelta64[ns]',
+	'day_of_week': ordered(DAYS_OF_WEEK),
+	'age_band_of_driver': ordered(AGE_BANDS),
+	'sex_of_driver': 'category',
+	'educational_level': ordered(EDU_LEVELS),
+	'vehicle_driver_relation': 'category',
+	'driving_experience': 'category',
+	'type_of_vehicle': 'category',
+	'owner_of_vehicle': 'category',
+	'service_year_of_vehicle': 'category',
+	'defect_of_vehicle': 'category',
+	'area_accident_occured': 'category',
+	'lanes_or_medians': 'category',
+	'road_allignment': 'category',
+	'types_of_junction': 'category',
+	'road_surface_type': 'category',
+	'road_surface_conditions': 'category',
+	'light_conditions': 'category',
+	'weather_conditions': 'category',
+	'type_of_collision': 'category',
+	'number_of_vehicles_involved': 'UInt8',
+	'number_of_casualties': 'UInt8',
+	'vehicle_movement': 'category',
+	'casualty_class': 'category',
+	'sex_of_casualty': 'category',
+	'age_band_of_casualty': 'category',
+	'casualty_severity': 'category',
+	'work_of_casuality': 'category',
+	'fitness_of_casuality': 'category',
+	'pedestrian_movement': 'category',
+	'cause_of_accident': 'category',
+	'accident_severity': ordered(ACCIDENT_SEVERITY_ORDER),
+	# Derived during cleaning
+	'hour': 'Int8',
+	'minute': 'Int8',
+	'part_of_day': ordered(PART_OF_DAY),
+	'casualty_count': 'UInt8',
+}
+
+# Full range of derived numeric columns, so binned charts use the same bins
+# whatever rows are selected (see utils.aggregations.fit_budget).
+VALUE_RANGES = {'hour': (0, 23), 'minute': (0, 59)}
+
+# Raw columns that must not be read as categoricals.
+NUMERIC_COLUMNS = [col for col, dtype in SCHEMA.items() if isinstance(dtype, str) and dtype[0] in 'IU']
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+	"""Casts every column listed in SCHEMA to its declared dtype."""
+	for col, dtype in SCHEMA.items():
+		if col not in df.columns or df[col].dtype == dtype:
+			continue
+		if isinstance(dtype, str) and dtype[0] in 'IU':
+			df[col] = _to_small_int(df[col], dtype)
+		elif isinstance(dtype, pd.CategoricalDtype) and isinstance(df[col].dtype, pd.CategoricalDtype):
+			df[col] = df[col].cat.set_categories(dtype.categories, ordered=dtype.ordered)
+		else:
+			df[col] = df[col].astype(dtype)
+	return df
+
+def _to_small_int(s: pd.Series, dtype: str) -> pd.Series:
+	"""Nullable small int; widens to Int64 instead of overflowing."""
+	values = pd.to_numeric(s, errors='coerce')
+	info = np.iinfo(dtype.lower())
+	if values.notna().any() and (values.min() < info.min or values.max() > info.max):
+		dtype = 'Int64'
+	return values.astype(dtype)
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+	"""Bytes per column (deep) and dtypes before/after, largest savings first."""
+	report = pd.DataFrame({
+		'dtype_before': before.dtypes.astype(str),
+		'bytes_before': before.memory_usage(index=False, deep=True),
+		'dtype_after': after.dtypes.astype(str),
+		'bytes_after': after.memory_usage(index=False, deep=True),
+	})
+	report['bytes_before'] = report['bytes_before'].astype('Int64')
+	report['bytes_after'] = report['bytes_after'].astype('Int64')
+	report['saved_pct'] = (100 * (1 - report['bytes_after'] / report['bytes_before'])).round(1)
+	report.index.name = 'column'
+	return report.sort_values('bytes_before', ascending=False)
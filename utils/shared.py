@@ -0,0 +1,278 @@
+import atexit
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Directory shared by every server process on the host; the store is off
+# unless it is set (see README "Notes"). /dev/shm keeps the files in RAM.
+SHARED_DIR = os.environ.get('RTA_SHARED_DIR')
+# Schema metadata key holding how to rebuild each pandas column.
+META_KEY = b'rta.columns'
+MASK_SUFFIX = '.__mask'
+# Filter bitmaps published next to a version's frame (see SharedDataset).
+INDEX_SUFFIX = '.index.arrow'
+
+# Leases held by this process: {(shared_dir, key): version}.
+_leases = {}
+
+def _layout(df: pd.DataFrame):
+	"""Arrow columns and rebuild metadata for `df`, using layouts that map
+	back to pandas without a copy: categorical codes as plain int8 columns
+	(dictionary in the metadata), nullable ints as values plus a uint8 mask,
+	datetimes and timedeltas as int64, bools as uint8. Other columns go
+	through Arrow's own conversion (and are copied on attach)."""
+	arrays, names, meta = [], [], {}
+	for col in df.columns:
+		s = df[col]
+		if isinstance(s.dtype, pd.CategoricalDtype):
+			meta[col] = {'kind': 'category', 'categories': s.cat.categories.tolist(), 'ordered': bool(s.cat.ordered)}
+			arrays.append(pa.array(s.cat.codes.to_numpy()))
+		elif hasattr(s.array, '_mask'):
+			# Nullable Int/UInt/Float/boolean: the same two arrays pandas holds.
+			meta[col] = {'kind': 'masked', 'dtype': str(s.dtype)}
+			names += [col, col + MASK_SUFFIX]
+			arrays += [pa.array(s.array._data), pa.array(s.array._mask.view(np.uint8))]
+			continue
+		elif s.dtype.kind in 'mM':
+			meta[col] = {'kind': 'datetime', 'dtype': str(s.dtype)}
+			arrays.append(pa.array(s.to_numpy().view(np.int64)))
+		elif s.dtype.kind == 'b':
+			meta[col] = {'kind': 'bool'}
+			arrays.append(pa.array(s.to_numpy().view(np.uint8)))
+		elif s.dtype.kind in 'iuf':
+			meta[col] = {'kind': 'numpy'}
+			arrays.append(pa.array(s.to_numpy()))
+		else:
+			meta[col] = {'kind': 'arrow'}
+			arrays.append(pa.array(s, from_pandas=True))
+		names.append(col)
+	schema = pa.schema([pa.field(name, array.type) for name, array in zip(names, arrays)],
+		metadata={META_KEY: json.dumps({'columns': list(df.columns), 'layout': meta})})
+	return pa.Table.from_arrays(arrays, schema=schema)
+
+def _rebuild(table: pa.Table) -> pd.DataFrame:
+	"""DataFrame over the table's buffers (read-only numpy views, no copy)."""
+	meta = json.loads(table.schema.metadata[META_KEY])
+	def values(name):
+		return table.column(name).chunk(0).to_numpy(zero_copy_only=True)
+	columns = {}
+	for col in meta['columns']:
+		layout = meta['layout'][col]
+		kind = layout['kind']
+		if kind == 'category':
+			dtype = pd.CategoricalDtype(layout['categories'], ordered=layout['ordered'])
+			array = pd.Categorical.from_codes(values(col), dtype=dtype)
+		elif kind == 'masked':
+			array_type = pd.api.types.pandas_dtype(layout['dtype']).construct_array_type()
+			array = array_type(values(col), values(col + MASK_SUFFIX).view(bool), copy=False)
+		elif kind == 'datetime':
+			array = values(col).view(layout['dtype'])
+		elif kind == 'bool':
+			array = values(col).view(bool)
+		elif kind == 'numpy':
+			array = values(col)
+		else:
+			array = table.column(col).to_pandas().array
+		columns[col] = pd.Series(array, name=col, copy=False)
+	return pd.DataFrame(columns, copy=False)
+
+def freeze(df: pd.DataFrame) -> pd.DataFrame:
+	"""Read-only version of `df` over Arrow buffers, in the same layout as the
+	shared store: any in-place write raises ValueError, so one instance can
+	be handed to every session without defensive copies. The result may
+	reuse `df`'s buffers, so `df` itself should not be modified afterwards.
+	Only a RangeIndex is kept."""
+	return _rebuild(_layout(df).combine_chunks())
+
+def write_arrow(df: pd.DataFrame, path: str) -> None:
+	"""Writes `df` as an uncompressed Arrow IPC file (one record batch, so
+	every column is one contiguous mappable buffer)."""
+	table = _layout(df).combine_chunks()
+	tmp = path + f'.{os.getpid()}.tmp'
+	with pa.OSFile(tmp, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+		writer.write_table(table, max_chunksize=max(len(table), 1))
+	os.replace(tmp, path)
+
+def read_arrow(path: str) -> pd.DataFrame:
+	"""Memory-maps an Arrow file written by write_arrow. Pages are shared with
+	every other process mapping the same file; the frame is read-only."""
+	with pa.memory_map(path, 'r') as source:
+		table = pa.ipc.open_file(source).read_all()
+	return _rebuild(table)
+
+def write_bitmaps(bitmaps: dict, path: str) -> None:
+	"""Writes filter bitmaps ({column: {value: packed uint8 array}}, see
+	utils.filters.build_bitmaps) as one Arrow column per value; all arrays
+	have the same length, (rows + 7) // 8."""
+	write_arrow(pd.DataFrame({
+		json.dumps([col, value]): bits for col, values in bitmaps.items() for value, bits in values.items()
+	}), path)
+
+def read_bitmaps(path: str) -> dict:
+	"""Memory-maps bitmaps written by write_bitmaps; the arrays are read-only
+	views of the shared pages."""
+	bitmaps = {}
+	for name, bits in read_arrow(path).items():
+		col, value = json.loads(name)
+		bitmaps.setdefault(col, {})[value] = bits.to_numpy()
+	return bitmaps
+
+def _key(source: str) -> str:
+	return hashlib.sha1(os.path.abspath(source).encode()).hexdigest()[:12]
+
+def _alive(pid: int) -> bool:
+	try:
+		os.kill(pid, 0)
+	except ProcessLookupError:
+		return False
+	except PermissionError:
+		pass
+	return True
+
+class SharedDataset:
+	"""One attached version of a published dataset.
+
+	The store keeps, per source path, `<key>.json` naming the current
+	version and one `<key>-<version>.arrow` file per version, with its
+	filter bitmaps in `<key>-<version>.index.arrow` when attach() is given
+	an `index` function. Each process
+	attached to a version holds a lease file `<key>-<version>.leases/<pid>`;
+	the number of live leases is the version's reference count. A version
+	file is deleted once it is no longer current and no live process holds a
+	lease (processes that died without releasing are detected by pid).
+	"""
+
+	def __init__(self, shared_dir: str, key: str, version: str):
+		self.shared_dir = shared_dir
+		self.key = key
+		self.version = version
+		self.path = os.path.join(shared_dir, f'{self.key}-{version}.arrow')
+		self.index_path = self.path[:-len('.arrow')] + INDEX_SUFFIX
+		self.frame = None
+		self.bitmaps = None
+
+	@property
+	def lease_dir(self) -> str:
+		return self.path[:-len('.arrow')] + '.leases'
+
+	def leases(self) -> list:
+		"""Pids of live processes attached to this version."""
+		try:
+			pids = [int(name) for name in os.listdir(self.lease_dir)]
+		except FileNotFoundError:
+			return []
+		return [pid for pid in pids if _alive(pid)]
+
+	def _lock(self):
+		# fcntl is Unix-only; import it here so that loading this module (for
+		# freeze()) still works on Windows, where the store is unavailable.
+		try:
+			import fcntl
+		except ImportError:
+			raise RuntimeError("The shared dataset store (RTA_SHARED_DIR) needs a Unix host") from None
+		lock = open(os.path.join(self.shared_dir, f'{self.key}.lock'), 'w')
+		fcntl.flock(lock, fcntl.LOCK_EX)
+		return lock
+
+	def _pointer_path(self) -> str:
+		return os.path.join(self.shared_dir, f'{self.key}.json')
+
+	def current(self):
+		try:
+			with open(self._pointer_path(), encoding='utf-8') as f:
+				return json.load(f)
+		except (OSError, ValueError):
+			return None
+
+	def attach(self, source: str, load, index=None) -> 'SharedDataset':
+		"""Maps this version, publishing it first (with `load()`, reading
+		`source`) if no process has yet. Publishing happens under an
+		exclusive lock, so workers starting together load the source once.
+		With `index`, index(frame) is published too and mapped as `bitmaps`."""
+		os.makedirs(self.shared_dir, exist_ok=True)
+		with self._lock():
+			pointer = self.current()
+			if (pointer is None or pointer['version'] != self.version or not os.path.exists(self.path)
+					or (index is not None and not os.path.exists(self.index_path))):
+				started = time.perf_counter()
+				df = load()
+				write_arrow(df, self.path)
+				if index is not None:
+					write_bitmaps(index(df), self.index_path)
+				tmp = self._pointer_path() + f'.{os.getpid()}.tmp'
+				with open(tmp, 'w', encoding='utf-8') as f:
+					json.dump({
+						'source': os.path.abspath(source),
+						'version': self.version,
+						'file': os.path.basename(self.path),
+						'rows': len(df),
+						'bytes': os.path.getsize(self.path),
+						'publisher': os.getpid(),
+						'seconds': round(time.perf_counter() - started, 3),
+					}, f, indent=2)
+				os.replace(tmp, self._pointer_path())
+			os.makedirs(self.lease_dir, exist_ok=True)
+			open(os.path.join(self.lease_dir, str(os.getpid())), 'w').close()
+			previous = _leases.get((self.shared_dir, self.key))
+			_leases[(self.shared_dir, self.key)] = self.version
+			if previous is not None and previous != self.version:
+				SharedDataset(self.shared_dir, self.key, previous)._release()
+			self._collect()
+		self.frame = read_arrow(self.path)
+		if index is not None:
+			self.bitmaps = read_bitmaps(self.index_path)
+		return self
+
+	def release(self) -> None:
+		"""Drops this process's lease; the mapping itself stays valid until
+		the frame is garbage collected (unlinked files stay mapped)."""
+		with self._lock():
+			if _leases.get((self.shared_dir, self.key)) == self.version:
+				del _leases[(self.shared_dir, self.key)]
+			self._release()
+			self._collect()
+
+	def _release(self) -> None:
+		try:
+			os.remove(os.path.join(self.lease_dir, str(os.getpid())))
+		except FileNotFoundError:
+			pass
+
+	def _collect(self) -> None:
+		"""Deletes versions of this source that are not current and have no
+		live leases. Called with the lock held."""
+		pointer = self.current()
+		prefix = f'{self.key}-'
+		for name in os.listdir(self.shared_dir):
+			if not (name.startswith(prefix) and name.endswith('.arrow')) or name.endswith(INDEX_SUFFIX):
+				continue
+			version = name[len(prefix):-len('.arrow')]
+			if pointer is not None and version == pointer['version']:
+				continue
+			old = SharedDataset(self.shared_dir, self.key, version)
+			if old.leases():
+				continue
+			for stale in os.listdir(old.lease_dir) if os.path.isdir(old.lease_dir) else []:
+				os.remove(os.path.join(old.lease_dir, stale))
+			if os.path.isdir(old.lease_dir):
+				os.rmdir(old.lease_dir)
+			os.remove(old.path)
+			if os.path.exists(old.index_path):
+				os.remove(old.index_path)
+
+def attach(source: str, version: str, load, shared_dir: str = None, index=None) -> SharedDataset:
+	"""Attaches this process to `version` of the dataset read from `source`.
+	`load()` returns the cleaned frame and is only called by the first
+	process to need this version; so is `index(frame)`, whose bitmaps are
+	published with it (utils.filters.build_bitmaps)."""
+	return SharedDataset(shared_dir or SHARED_DIR, _key(source), version).attach(source, load, index)
+
+@atexit.register
+def _release_all() -> None:
+	for (shared_dir, key), version in list(_leases.items()):
+		SharedDataset(shared_dir, key, version)._release()
@@ -1,10 +1,95 @@
+import hashlib
+import json
+
+import altair as alt
+import pandas as pd
 import streamlit as st
 
-def draw_chart(chart, title):
+from utils import perf
+from utils.i18n import language, localize_spec, relabel
+from utils.memo import AggregationCache
+from utils.sampling import preliminary_badge
+from utils.schema import ACCIDENT_SEVERITY_ORDER
+
+# 严重程度统一配色（各图共用）
+SEVERITY_COLORS = ['#4C78A8', '#E34C31', '#943E2C']
+SEVERITY_SCALE = alt.Scale(domain=ACCIDENT_SEVERITY_ORDER, range=SEVERITY_COLORS)
+
+def severity_color(title='Severity'):
+	"""按事故严重程度着色的统一编码。"""
+	return alt.Color('accident_severity', scale=SEVERITY_SCALE, title=title)
+
+# 图表模板注册表：模板 id -> {'title', 'build', 'specs'}
+TEMPLATES = {}
+# 已填入数据的完整 spec，按 (模板 id, 语言, 数据内容哈希) 缓存，所有会话共用
+SPEC_CACHE = AggregationCache(maxsize=256)
+
+def chart_template(template_id, title):
 	"""
-	统一风格的Altair图表展示函数。
-	:param chart: Altair图表对象
+	注册图表模板的装饰器。
+	被装饰函数接收聚合后的 DataFrame 并返回 Altair 图表；每种列类型组合只构建并校验一次
+	Vega-Lite spec，之后每次重跑只替换数据。
+	:param template_id: 模板 id
 	:param title: 图表标题
 	"""
-	chart = chart.properties(title=title).interactive()
-	st.altair_chart(chart, use_container_width=True)
+	def register(build):
+		TEMPLATES[template_id] = {'title': title, 'build': build, 'specs': {}}
+		return build
+	return register
+
+def template_spec(template_id, data, lang='en'):
+	"""不含数据的 spec（按列名与类型、语言缓存）；非英文时标题与类别排序/配色域已翻译。"""
+	template = TEMPLATES[template_id]
+	key = tuple((col, str(dtype)) for col, dtype in data.dtypes.items())
+	if lang != 'en':
+		if (key, lang) not in template['specs']:
+			template['specs'][(key, lang)] = localize_spec(template_spec(template_id, data), lang)
+		return template['specs'][(key, lang)]
+	if key not in template['specs']:
+		chart = template['build'](data.iloc[:0]).properties(title=template['title']).interactive()
+		spec = chart.to_dict()
+		spec.pop('datasets', None)
+		if 'data' not in spec:
+			raise ValueError(f"Chart template {template_id!r} must use a single top-level data frame")
+		spec.pop('data')
+		# Vega-Lite's top-level name: the template id, the same in every language.
+		spec['name'] = template_id
+		template['specs'][key] = spec
+	return template['specs'][key]
+
+def data_key(data):
+	"""聚合结果的内容哈希（列名、类型 + 每行哈希）。"""
+	digest = hashlib.blake2b(digest_size=16)
+	digest.update(json.dumps([[str(c), str(t)] for c, t in data.dtypes.items()]).encode())
+	digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+	return digest.hexdigest()
+
+def filled_spec(template_id, data, lang='en'):
+	"""模板 spec + 内联数据（类别值按语言翻译）；聚合结果未变时直接返回缓存。
+	计时：取模板与缓存查找计入 spec，翻译与 JSON 序列化计入 serialize。"""
+	title = TEMPLATES[template_id]['title']
+	def build():
+		with perf.timed('spec', title):
+			template = template_spec(template_id, data, lang)
+		with perf.timed('serialize', title):
+			values = json.loads(relabel(data, lang).to_json(orient='records', date_format='iso'))
+		return {**template, 'data': {'values': values}}
+	with perf.timed('spec', title):
+		key = (template_id, lang, data_key(data))
+	return SPEC_CACHE.get_or_compute(key, build)
+
+def draw_template(template_id, data, ui=st):
+	"""
+	用注册的模板绘制图表。
+	:param template_id: chart_template 注册的模板 id
+	:param data: 聚合后的 DataFrame（抽样估计结果会先显示“初步结果”标记，见 utils/sampling.py）
+	:param ui: streamlit 模块、utils.i18n.LocalizedUI，或无界面运行时的 utils.headless.HeadlessUI
+	"""
+	title = TEMPLATES[template_id]['title']
+	preliminary_badge(data, ui)
+	spec = filled_spec(template_id, data, language(ui))
+	trace = perf.current()
+	if trace is not None:
+		trace.add_payload(title, spec)
+	with perf.timed('render', title):
+		ui.vega_lite_chart(spec=spec, width='stretch')